@@ -1,17 +1,31 @@
 import os
 import json
-import asyncio
+import csv
 import logging
+import functools
+import itertools
+import math
+import multiprocessing
+import uuid
+import array
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, session
-from flask_socketio import SocketIO, emit
-import pandas as pd
-from datasets import load_dataset
-import evaluate
-from rouge_score import rouge_scorer
+from flask_socketio import SocketIO, emit, join_room
+from scoring import (
+    CachedRougeScorer, create_native_scorer, init_worker_scorer, native_fmeasures,
+    score_fmeasures, score_in_worker
+)
 import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import time
-from collections import defaultdict
+import queue
+from collections import deque
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:  # Socket.IO keeps the stdlib json module
+    orjson = None
 
 # Import appropriate config based on environment
 if os.environ.get('WEBSITE_SITE_NAME'):  # Azure App Service environment variable
@@ -25,19 +39,82 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='static', static_url_path='/static')
 app.config['SECRET_KEY'] = config.SECRET_KEY
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 
-# Thread-safe storage for session-based state
-session_states = defaultdict(lambda: {
-    'is_running': False,
-    'current_article': 0,
-    'total_articles': 0,
-    'results': [],
-    'logs': []
-})
+class OrjsonSerializer:
+    """Drop-in for the json module in Socket.IO packets, backed by orjson"""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode='threading',
+    json=OrjsonSerializer if orjson is not None else json
+)
+
+# Typecodes of the columnar result buffers; None means a plain list (strings)
+RESULT_COLUMNS = {
+    'article_id': 'i',
+    'configuration': None,
+    'article_length': 'i',
+    'reference_summary': None,
+    'generated_summary': None,
+    'rouge1': 'f',
+    'rouge2': 'f',
+    'rougeL': 'f',
+    'compression_ratio': 'f',
+    'processing_time': 'f',
+    'timestamp': None,
+    'source': None
+}
+
+# ROUGE scores every result carries; metrics left out of ROUGE_METRICS are None
+# (null in JSON, NaN in the float buffers, empty/null in exports)
+ROUGE_RESULT_METRICS = ('rouge1', 'rouge2', 'rougeL')
+
+def new_result_columns():
+    """Create empty struct-of-arrays buffers for evaluation results"""
+    return {name: array.array(typecode) if typecode else []
+            for name, typecode in RESULT_COLUMNS.items()}
+
+def new_evaluation_state():
+    """Fresh evaluation state for a session"""
+    return {
+        'is_running': False,
+        'current_article': 0,
+        'total_articles': 0,
+        'results': [],
+        'result_columns': new_result_columns(),
+        'logs': deque(maxlen=config.LOG_MAX_ENTRIES)
+    }
+
+# Thread-safe storage for session-based state. Sessions are spread over
+# SESSION_SHARDS caches, each with its own lock, so unrelated sessions don't
+# contend; idle sessions expire after SESSION_TTL_SECONDS.
+SESSION_SHARDS = 16
+session_shards = [
+    (threading.Lock(), TTLCache(maxsize=config.SESSION_CACHE_SIZE // SESSION_SHARDS,
+                                ttl=config.SESSION_TTL_SECONDS))
+    for _ in range(SESSION_SHARDS)
+]
+# States of running evaluations, kept out of the shards so LRU/TTL eviction
+# can't drop them mid-run; handed back when run_evaluation finishes
+running_states = {}
+running_lock = threading.Lock()
 
-pending_requests_store = defaultdict(dict)
-session_lock = threading.Lock()
+# In-flight browser requests across all sessions, keyed by their unique request_id
+pending_requests = {}
+completed_requests = {}  # session_id -> ids of answered requests still in pending_requests
+results_lock = threading.Lock()  # Keeps the columnar result buffers row-aligned
+connected_clients = set()  # Socket.IO sids of connected browsers
+export_executor = ThreadPoolExecutor(max_workers=2)  # Writes result exports off the request thread
+log_queue = queue.Queue(maxsize=1024)  # Log entries waiting for the background flusher
 
 def get_session_id():
     """Get session ID, creating one if it doesn't exist"""
@@ -45,63 +122,275 @@ def get_session_id():
         session['session_id'] = f"session_{int(time.time() * 1000)}"
     return session['session_id']
 
+def join_session_room(session_id, socket_id):
+    """Add the page's socket to its session's room from an HTTP request
+
+    A socket opened on the first page load, before the session cookie was
+    set, joined a room under a different session ID in handle_connect.
+    """
+    if socket_id in connected_clients:
+        join_room(session_id, sid=socket_id, namespace='/')
+
+def session_shard(session_id):
+    """(lock, cache) pair holding a session's state"""
+    return session_shards[hash(session_id) % SESSION_SHARDS]
+
 def get_evaluation_state(session_id=None):
     """Get or create evaluation state for current session"""
     try:
         if session_id is None:
             session_id = get_session_id()
         
-        with session_lock:
-            return session_states[session_id]
-    except RuntimeError:
-        # Outside request context, return default state
-        return {
-            'is_running': False,
-            'current_article': 0,
-            'total_articles': 0,
-            'results': [],
-            'logs': []
-        }
-
-def get_pending_requests(session_id=None):
-    """Get or create pending requests dict for current session"""
-    try:
-        if session_id is None:
-            session_id = get_session_id()
+        state = running_states.get(session_id)
+        if state is not None:
+            return state
         
-        with session_lock:
-            return pending_requests_store[session_id]
+        lock, states = session_shard(session_id)
+        with lock:
+            state = states.get(session_id)
+            if state is None:
+                state = new_evaluation_state()
+            states[session_id] = state  # (Re)inserting restarts the TTL
+            return state
     except RuntimeError:
-        # Outside request context, return empty dict
-        return {}
+        # Outside request context, return default state
+        return new_evaluation_state()
 
-def save_evaluation_state(session_id, state):
-    """Save evaluation state for a session"""
-    with session_lock:
-        session_states[session_id] = state
+def claim_evaluation(session_id):
+    """Mark a session's evaluation as running and pin its state.
+    
+    Returns the state, or None if this session already has an evaluation running.
+    """
+    with running_lock:
+        if session_id in running_states:
+            return None
+        state = get_evaluation_state(session_id)
+        state['is_running'] = True
+        running_states[session_id] = state
+        return state
 
-def save_pending_requests(session_id, requests):
-    """Save pending requests for a session"""
-    with session_lock:
-        pending_requests_store[session_id] = requests
+def release_evaluation(session_id):
+    """Move a finished evaluation's state back into its session shard"""
+    with running_lock:
+        state = running_states.pop(session_id, None)
+    if state is not None:
+        lock, states = session_shard(session_id)
+        with lock:
+            states[session_id] = state
 
 def cleanup_completed_requests(session_id):
     """Clean up completed requests to prevent memory buildup"""
-    pending_requests = get_pending_requests(session_id)
-    completed_requests = [req_id for req_id, req_data in pending_requests.items() 
-                         if req_data.get('completed', False)]
+    request_ids = completed_requests.pop(session_id, ())
+    
+    for req_id in request_ids:
+        pending_requests.pop(req_id, None)
+    
+    if request_ids:
+        log_message(f"Cleaned up {len(request_ids)} completed requests", session_id)
+
+def record_result(evaluation_state, result):
+    """Append a result to the session's result list and columnar buffers"""
+    evaluation_state['results'].append(result)
+    columns = evaluation_state['result_columns']
+    for name in RESULT_COLUMNS:
+        if name in result:
+            columns[name].append(result[name])
+        else:
+            score = result['rouge_scores'][name]
+            columns[name].append(math.nan if score is None else score)
+
+def write_results_csv(filename, result_columns):
+    """Stream the columnar result buffers to a CSV file row by row"""
+    float_columns = [RESULT_COLUMNS[name] == 'f' for name in RESULT_COLUMNS]
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_COLUMNS)
+        for row in zip(*(result_columns[name] for name in RESULT_COLUMNS)):
+            # float32 buffers widen to doubles, trim back to float32 precision;
+            # NaN (a metric that wasn't computed) is written as an empty field
+            writer.writerow([('' if math.isnan(value) else format(value, '.7g')) if is_float else value
+                             for value, is_float in zip(row, float_columns)])
+
+def write_results_parquet(filename, result_columns):
+    """Write the columnar result buffers to a zstd-compressed Parquet file.
     
-    for req_id in completed_requests:
-        del pending_requests[req_id]
+    Numeric buffers are handed to Arrow without copying (NaN, an uncomputed
+    metric, becomes null); string columns get Parquet's dictionary encoding.
+    """
+    # Imported on first export to keep Arrow out of server start-up
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
     
-    if completed_requests:
-        save_pending_requests(session_id, pending_requests)
-        log_message(f"Cleaned up {len(completed_requests)} completed requests", session_id)
+    table = pa.table({
+        name: pa.array(np.frombuffer(column, dtype=typecode), from_pandas=True) if typecode
+        else pa.array(column, type=pa.string())
+        for (name, typecode), column in zip(RESULT_COLUMNS.items(),
+                                            (result_columns[name] for name in RESULT_COLUMNS))
+    })
+    pq.write_table(table, filename, compression='zstd')
+
+def serialize_evaluation_state(evaluation_state):
+    """JSON-safe view of the evaluation state (without the columnar buffers)"""
+    state = {key: value for key, value in evaluation_state.items() if key != 'result_columns'}
+    state['logs'] = list(evaluation_state['logs'])
+    return state
+
+# Every summarizer type/length/format combination evaluated in 'all' mode
+ALL_CONFIGURATIONS = tuple(
+    f"{summary_type}_{length}_{summary_format}"
+    for summary_type, length, summary_format in itertools.product(
+        ('tldr', 'key-points', 'teaser', 'headline'),
+        ('short', 'medium', 'long'),
+        ('plain-text', 'markdown')
+    )
+)
+
+def as_text(value):
+    """Join list-typed dataset fields (e.g. segmented articles) into one string"""
+    return ' '.join(value) if isinstance(value, list) else value
+
+def normalize_batch(batch, indices, article_field, summary_field):
+    """Dataset.map function producing string `_article`/`_summary` columns"""
+    return {
+        '_index': indices,
+        '_article': [as_text(article) for article in batch[article_field]],
+        '_summary': [as_text(summary) for summary in batch[summary_field]]
+    }
+
+class EventBatcher:
+    """Coalesces per-article Socket.IO events into 'progress_batch' emits.
+    
+    Events are flushed once PROGRESS_FLUSH_EVERY of them are queued, and at
+    least every PROGRESS_FLUSH_INTERVAL_MS by the background `run` loop.
+    The client replays each batched {'event', 'data'} entry in order.
+    """
+    
+    def __init__(self):
+        self._events = []
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def add(self, event, data):
+        with self._lock:
+            self._events.append({'event': event, 'data': data})
+            full = len(self._events) >= config.PROGRESS_FLUSH_EVERY
+        if full:
+            self.flush()
+    
+    def flush(self):
+        with self._lock:
+            events, self._events = self._events, []
+            if events:
+                socketio.emit('progress_batch', events)
+    
+    def run(self):
+        """Periodic flusher, started with socketio.start_background_task"""
+        while not self._closed:
+            socketio.sleep(config.PROGRESS_FLUSH_INTERVAL_MS / 1000)
+            self.flush()
+    
+    def close(self):
+        """Stop the periodic flusher and send anything still queued"""
+        self._closed = True
+        self.flush()
+
+@functools.lru_cache(maxsize=8)
+def load_raw_dataset(dataset_key, streaming=False):
+    """Load a HuggingFace dataset split once per process.
+    
+    The returned dataset is backed by memory-mapped Arrow files, so keeping it
+    cached is cheap and later evaluation runs skip the load entirely. With
+    streaming=True an IterableDataset is returned and nothing is downloaded
+    up front.
+    """
+    # Imported on first use: datasets pulls in Arrow and friends, which
+    # would otherwise slow every cold start
+    from datasets import load_dataset
+    
+    dataset_config = config.AVAILABLE_DATASETS[dataset_key]
+    if dataset_config['version']:
+        return load_dataset(
+            dataset_config['dataset_name'], 
+            dataset_config['version'], 
+            split=dataset_config['split'],
+            streaming=streaming
+        )
+    return load_dataset(
+        dataset_config['dataset_name'], 
+        split=dataset_config['split'],
+        streaming=streaming
+    )
+
+def stream_filtered_articles(dataset_key, max_articles):
+    """Read a streamed split only until `max_articles` articles under the length limit are found"""
+    dataset_config = config.AVAILABLE_DATASETS[dataset_key]
+    dataset = load_raw_dataset(dataset_key, streaming=True)
+    article_field = dataset_config['article_field']
+    summary_field = dataset_config['summary_field']
+    max_length = config.MAX_ARTICLE_LENGTH
+    
+    articles = ({
+        'id': index,
+        'article': as_text(example[article_field]),
+        'reference_summary': as_text(example[summary_field]),
+        'dataset': dataset_key
+    } for index, example in enumerate(dataset))
+    return tuple(itertools.islice(
+        (article for article in articles if len(article['article']) < max_length),
+        max_articles
+    ))
+
+@functools.lru_cache(maxsize=8)
+def load_filtered_articles(dataset_key, max_articles):
+    """Return the first `max_articles` articles under the length limit (cached)"""
+    if config.DATASET_STREAMING:
+        return stream_filtered_articles(dataset_key, max_articles)
+    
+    dataset_config = config.AVAILABLE_DATASETS[dataset_key]
+    dataset = load_raw_dataset(dataset_key)
+    
+    max_length = config.MAX_ARTICLE_LENGTH
+    
+    # Normalize the article/summary fields to plain strings once, in batches,
+    # keeping the original row index as the article ID. This runs in-process:
+    # num_proc would fork the threaded Socket.IO server from this background
+    # task, and worker startup outweighs the work at this dataset size
+    dataset = dataset.map(
+        normalize_batch,
+        batched=True,
+        with_indices=True,
+        remove_columns=dataset.column_names,
+        fn_kwargs={
+            'article_field': dataset_config['article_field'],
+            'summary_field': dataset_config['summary_field']
+        }
+    )
+    
+    # Filter articles to stay under character limit (batched, in-process like the map)
+    filtered = dataset.filter(
+        lambda batch: [len(article) < max_length for article in batch['_article']],
+        batched=True
+    )
+    subset = filtered.select(range(min(max_articles, len(filtered))))
+    
+    return tuple({
+        'id': example['_index'],
+        'article': example['_article'],
+        'reference_summary': example['_summary'],
+        'dataset': dataset_key
+    } for example in subset)
 
 class SummarizationEvaluator:
     def __init__(self):
-        self.rouge_scorer = rouge_scorer.RougeScorer(config.ROUGE_METRICS, use_stemmer=config.USE_STEMMER)
+        self.rouge_scorer = CachedRougeScorer(config.ROUGE_METRICS, use_stemmer=config.USE_STEMMER)
+        self.native_scorer = create_native_scorer(config.ROUGE_METRICS, config.USE_STEMMER)
+        self._unscored_metrics = {metric: None for metric in ROUGE_RESULT_METRICS
+                                  if metric not in config.ROUGE_METRICS}
         self.results = []
+        self._ref_cache = {}  # (dataset, article id) -> reference summary tokens
+        self._pool = None  # ROUGE worker processes, started on first use
+        self._pool_lock = threading.Lock()
         
     def load_dataset(self, dataset_key='cnn_dailymail', max_articles=config.DEFAULT_MAX_ARTICLES):
         """Load dataset with configurable dataset type"""
@@ -116,66 +405,96 @@ class SummarizationEvaluator:
             if dataset_key == 'sample':
                 return self._get_sample_articles(max_articles)
             
-            # Load from HuggingFace datasets
-            if dataset_config['version']:
-                dataset = load_dataset(
-                    dataset_config['dataset_name'], 
-                    dataset_config['version'], 
-                    split=dataset_config['split']
-                )
-            else:
-                dataset = load_dataset(
-                    dataset_config['dataset_name'], 
-                    split=dataset_config['split']
-                )
-            
-            # Filter articles to stay under character limit
-            filtered_articles = []
-            for i, article in enumerate(dataset):
-                article_text = article[dataset_config['article_field']]
-                summary_text = article[dataset_config['summary_field']]
-                
-                # Handle different data types (string vs list)
-                if isinstance(article_text, list):
-                    article_text = ' '.join(article_text)
-                if isinstance(summary_text, list):
-                    summary_text = ' '.join(summary_text)
-                
-                if len(article_text) < config.MAX_ARTICLE_LENGTH and len(filtered_articles) < max_articles:
-                    filtered_articles.append({
-                        'id': i,
-                        'article': article_text,
-                        'reference_summary': summary_text,
-                        'dataset': dataset_key
-                    })
+            filtered_articles = load_filtered_articles(dataset_key, max_articles)
             
             logger.info(f"Loaded {len(filtered_articles)} articles from {dataset_config['name']}")
-            return filtered_articles
+            return list(filtered_articles)
         except Exception as e:
             logger.error(f"Error loading dataset {dataset_key}: {e}")
             return self._get_sample_articles(max_articles)
     
     def _get_sample_articles(self, max_articles):
         """Fallback sample articles if dataset loading fails"""
-        sample_count = min(max_articles, len(config.SAMPLE_ARTICLES))
+        sample_articles = config.get_sample_articles()
+        sample_count = min(max_articles, len(sample_articles))
         articles = []
-        for i, article in enumerate(config.SAMPLE_ARTICLES[:sample_count]):
+        for i, article in enumerate(sample_articles[:sample_count]):
             articles.append({
                 **article,
                 'dataset': 'sample'
             })
         return articles
     
-    def calculate_rouge_scores(self, reference, generated):
+    def prepare_reference(self, article):
+        """Tokenize an article's reference summary once for all its configurations"""
+        if self.native_scorer is not None:
+            return None  # rouge-score-rs tokenizes natively on every call
+        key = (article['dataset'], article['id'])
+        if key not in self._ref_cache:
+            self._ref_cache[key] = self.rouge_scorer.tokenize(article['reference_summary'])
+        return self._ref_cache[key]
+    
+    def release_reference(self, article):
+        """Drop the cached reference tokens once an article is finished"""
+        self._ref_cache.pop((article['dataset'], article['id']), None)
+    
+    def calculate_rouge_scores(self, article, generated):
         """Calculate ROUGE scores for evaluation"""
-        scores = self.rouge_scorer.score(reference, generated)
-        return {
-            'rouge1': scores['rouge1'].fmeasure,
-            'rouge2': scores['rouge2'].fmeasure,
-            'rougeL': scores['rougeL'].fmeasure
-        }
+        return self.calculate_rouge_scores_batch(article, [generated])[0]
+    
+    def calculate_rouge_scores_batch(self, article, generated_summaries):
+        """Calculate ROUGE scores for several summaries of the same article.
+        
+        Only the metrics in ROUGE_METRICS are computed; the others are None.
+        """
+        if self.native_scorer is not None:
+            scores = native_fmeasures(self.native_scorer, article['reference_summary'], generated_summaries)
+        else:
+            target_tokens = self._ref_cache.get((article['dataset'], article['id']))
+            if target_tokens is None:
+                target_tokens = self.rouge_scorer.tokenize(article['reference_summary'])
+            
+            pool = self._get_pool()
+            if pool is None:
+                scores = score_fmeasures(self.rouge_scorer, target_tokens, generated_summaries)
+            else:
+                # Stemming and n-gram matching are CPU-bound; run them outside the GIL
+                scores = pool.submit(score_in_worker, target_tokens, generated_summaries).result()
+        
+        if self._unscored_metrics:
+            scores = [{**self._unscored_metrics, **result} for result in scores]
+        return scores
+    
+    def _get_pool(self):
+        """Lazily start the ROUGE worker processes (None when disabled)"""
+        if self._pool is None and config.ROUGE_WORKERS != 0:
+            with self._pool_lock:
+                if self._pool is None:
+                    # Spawned (not forked) workers: forking this multi-threaded
+                    # server can deadlock the child, and spawn works on Windows too
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=config.ROUGE_WORKERS or os.cpu_count(),
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=init_worker_scorer,
+                        initargs=(config.ROUGE_METRICS, config.USE_STEMMER)
+                    )
+        return self._pool
 
-evaluator = SummarizationEvaluator()
+_evaluator = None
+_evaluator_lock = threading.Lock()
+
+def get_evaluator():
+    """The shared evaluator, created on first use.
+    
+    Not built at import time, so spawned ROUGE workers that re-import the
+    main module don't construct one.
+    """
+    global _evaluator
+    if _evaluator is None:
+        with _evaluator_lock:
+            if _evaluator is None:
+                _evaluator = SummarizationEvaluator()
+    return _evaluator
 
 @app.route('/')
 def index():
@@ -196,10 +515,6 @@ def get_datasets():
 @app.route('/api/start_evaluation', methods=['POST'])
 def start_evaluation():
     session_id = get_session_id()
-    evaluation_state = get_evaluation_state(session_id)
-    
-    if evaluation_state['is_running']:
-        return jsonify({'error': 'Evaluation already running'}), 400
     
     max_articles = request.json.get('max_articles', config.DEFAULT_MAX_ARTICLES)
     max_articles = min(max_articles, config.MAX_ALLOWED_ARTICLES)  # Enforce maximum limit
@@ -212,14 +527,22 @@ def start_evaluation():
     if selected_dataset not in config.AVAILABLE_DATASETS:
         return jsonify({'error': f'Invalid dataset: {selected_dataset}'}), 400
     
+    # Atomically check for and pin a running evaluation, so two requests
+    # can't both start one for the same session
+    evaluation_state = claim_evaluation(session_id)
+    if evaluation_state is None:
+        return jsonify({'error': 'Evaluation already running'}), 400
+    
+    # Article text and summarize requests go to this session's room only
+    join_session_room(session_id, request.json.get('socket_id'))
+    
     # Store evaluation configuration in state
     evaluation_state['evaluation_mode'] = evaluation_mode
     evaluation_state['selected_config'] = selected_config
     evaluation_state['selected_dataset'] = selected_dataset
     
-    # Start evaluation in background thread
-    thread = threading.Thread(target=run_evaluation, args=(max_articles, session_id))
-    thread.start()
+    # Start evaluation as a background task of the Socket.IO server
+    socketio.start_background_task(run_evaluation, max_articles, session_id)
     
     return jsonify({
         'message': 'Evaluation started', 
@@ -234,7 +557,6 @@ def stop_evaluation():
     session_id = get_session_id()
     evaluation_state = get_evaluation_state(session_id)
     evaluation_state['is_running'] = False
-    save_evaluation_state(session_id, evaluation_state)
     return jsonify({'message': 'Evaluation stopped'})
 
 @app.route('/api/results')
@@ -246,96 +568,145 @@ def get_results():
 @app.route('/api/export_results')
 def export_results():
     session_id = get_session_id()
+    join_session_room(session_id, request.args.get('socket_id'))
     evaluation_state = get_evaluation_state(session_id)
     if evaluation_state['results']:
-        df = pd.DataFrame(evaluation_state['results'])
-        
         # Create results directory if it doesn't exist
         os.makedirs(config.RESULTS_DIR, exist_ok=True)
         
+        # Parquet by default; ?format=csv keeps the old plain-text export
+        export_format = 'csv' if request.args.get('format') == 'csv' else 'parquet'
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join(config.RESULTS_DIR, 
-                               f"evaluation_results_{session_id}_{timestamp}.csv")
+                               f"evaluation_results_{session_id}_{timestamp}.{export_format}")
         
-        df.to_csv(filename, index=False)
-        log_message(f"Results exported to {filename}", session_id)
-        return jsonify({'message': f'Results exported to {filename}', 'filename': filename})
+        # Snapshot the buffers so a running evaluation can keep appending
+        with results_lock:
+            result_columns = {name: column[:] for name, column in evaluation_state['result_columns'].items()}
+        
+        writer = write_results_csv if export_format == 'csv' else write_results_parquet
+        job_id = uuid.uuid4().hex[:12]
+        future = export_executor.submit(writer, filename, result_columns)
+        future.add_done_callback(functools.partial(notify_export_ready, job_id, filename, session_id))
+        
+        return jsonify({'message': 'Export started', 'job_id': job_id, 'filename': filename}), 202
     return jsonify({'error': 'No results to export'})
 
+def notify_export_ready(job_id, filename, session_id, future):
+    """Done callback of an export job: tell the browser the file is written (or why not)"""
+    # Only the requesting session's clients (its room) are told about the file
+    error = future.exception()
+    if error:
+        log_message(f"Error exporting results to {filename}: {error}", session_id)
+        socketio.emit('export_ready', {'job_id': job_id, 'filename': filename, 'error': str(error)},
+                      to=session_id)
+    else:
+        log_message(f"Results exported to {filename}", session_id)
+        socketio.emit('export_ready', {'job_id': job_id, 'filename': filename,
+                                       'message': f'Results exported to {filename}'},
+                      to=session_id)
+
 def run_evaluation(max_articles, session_id):
+    """Background task running one session's evaluation (claimed by start_evaluation)"""
     evaluation_state = get_evaluation_state(session_id)
-    
-    evaluation_state['is_running'] = True
-    evaluation_state['current_article'] = 0
-    evaluation_state['results'] = []
-    
-    # Get selected dataset
-    selected_dataset = evaluation_state.get('selected_dataset', config.DEFAULT_DATASET)
-    
-    # Load dataset
-    articles = evaluator.load_dataset(selected_dataset, max_articles)
-    evaluation_state['total_articles'] = len(articles)
-    
-    # Save state
-    save_evaluation_state(session_id, evaluation_state)
-    
-    dataset_name = config.AVAILABLE_DATASETS.get(selected_dataset, {}).get('name', selected_dataset)
-    log_message(f"Starting evaluation process with {dataset_name} dataset...", session_id)
-    socketio.emit('evaluation_started', {
-        'total_articles': len(articles),
-        'dataset': dataset_name
-    })
-    
-    for i, article in enumerate(articles):
-        # Get fresh state in case it was updated
-        evaluation_state = get_evaluation_state(session_id)
-        if not evaluation_state['is_running']:
-            break
-            
-        evaluation_state['current_article'] = i + 1
-        save_evaluation_state(session_id, evaluation_state)
+    try:
+        evaluation_state['current_article'] = 0
+        evaluation_state['results'] = []
+        evaluation_state['result_columns'] = new_result_columns()
         
-        log_message(f"Processing article {i + 1}/{len(articles)}", session_id)
-        socketio.emit('progress_update', {
-            'current': i + 1,
-            'total': len(articles),
-            'article_id': article['id']
-        })
+        # Get selected dataset
+        selected_dataset = evaluation_state.get('selected_dataset', config.DEFAULT_DATASET)
         
-        # Request summarization from browser
-        results = request_browser_summarization(article, session_id)
+        # Load dataset
+        articles = get_evaluator().load_dataset(selected_dataset, max_articles)
+        total = len(articles)
+        evaluation_state['total_articles'] = total
+        evaluation_state['last_progress_ts'] = 0.0
         
-        if results:
-            # Get fresh state and update results
-            evaluation_state = get_evaluation_state(session_id)
-            # Handle both single results and multiple results
-            if isinstance(results, list):
-                for result in results:
-                    evaluation_state['results'].append(result)
-                    socketio.emit('article_completed', result)
-            else:
-                evaluation_state['results'].append(results)
-                socketio.emit('article_completed', results)
+        dataset_name = config.AVAILABLE_DATASETS.get(selected_dataset, {}).get('name', selected_dataset)
+        log_message(f"Starting evaluation process with {dataset_name} dataset...", session_id)
+        socketio.emit('evaluation_started', {
+            'total_articles': total,
+            'dataset': dataset_name
+        }, to=session_id)
+        
+        # Progress and completed-article events go out in coalesced batches
+        progress_events = EventBatcher()
+        socketio.start_background_task(progress_events.run)
+        try:
+            # Keep up to MAX_CONCURRENT_ARTICLES articles in flight so the browser
+            # never sits idle between articles
+            with ThreadPoolExecutor(max_workers=config.MAX_CONCURRENT_ARTICLES) as executor:
+                futures = [executor.submit(process_article, i, article, total, session_id,
+                                           evaluation_state, progress_events)
+                           for i, article in enumerate(articles)]
             
-            save_evaluation_state(session_id, evaluation_state)
+            # The pool has finished; report articles that failed outside the
+            # browser request's own error handling
+            for article, future in zip(articles, futures):
+                error = future.exception()
+                if error:
+                    logger.error(f"Article {article['id']} failed", exc_info=error)
+                    log_message(f"Error processing article {article['id']}: {error}", session_id)
+        finally:
+            # Flush events still queued and stop the batcher even if the run failed
+            progress_events.close()
+        
+        # Clean up completed requests
+        cleanup_completed_requests(session_id)
         
-        time.sleep(config.PROGRESS_UPDATE_INTERVAL)  # Configurable delay between requests
+        log_message("Evaluation completed!", session_id)
+        socketio.emit('evaluation_completed', {'total_results': len(evaluation_state['results'])})
+    finally:
+        # Hand the state back to the (evictable) session cache
+        evaluation_state['is_running'] = False
+        release_evaluation(session_id)
+
+def process_article(i, article, total_articles, session_id, evaluation_state, progress_events):
+    """Evaluate one article and record its results"""
+    # stop_evaluation flips is_running on this same dict
+    if not evaluation_state['is_running']:
+        return
+        
+    position = i + 1
+    evaluation_state['current_article'] = position
     
-    # Final state update
-    evaluation_state = get_evaluation_state(session_id)
-    evaluation_state['is_running'] = False
-    save_evaluation_state(session_id, evaluation_state)
+    log_message(f"Processing article {position}/{total_articles}", session_id)
     
-    # Clean up completed requests
-    cleanup_completed_requests(session_id)
+    # Throttle progress events; the last article always reports
+    article_start = time.monotonic()
+    if (position == total_articles or
+            article_start - evaluation_state['last_progress_ts'] >= config.PROGRESS_THROTTLE_MS / 1000):
+        evaluation_state['last_progress_ts'] = article_start
+        progress_events.add('progress_update', {
+            'current': position,
+            'total': total_articles,
+            'article_id': article['id']
+        })
+    
+    # Request summarization from browser
+    get_evaluator().prepare_reference(article)
+    results = request_browser_summarization(article, session_id, evaluation_state)
+    get_evaluator().release_reference(article)
     
-    log_message("Evaluation completed!", session_id)
-    socketio.emit('evaluation_completed', {'total_results': len(evaluation_state['results'])})
+    if results:
+        # Handle both single results and multiple results
+        if not isinstance(results, list):
+            results = [results]
+        with results_lock:
+            for result in results:
+                record_result(evaluation_state, result)
+        for result in results:
+            progress_events.add('article_completed', result)
+    
+    # Pace requests to the browser API: each worker spends at least
+    # PROGRESS_UPDATE_INTERVAL per article, without adding delay to slow ones
+    elapsed = time.monotonic() - article_start
+    socketio.sleep(max(0, config.PROGRESS_UPDATE_INTERVAL - elapsed))
 
-def request_browser_summarization(article, session_id):
+def request_browser_summarization(article, session_id, evaluation_state):
     """Request summarization from browser and evaluate"""
     try:
-        evaluation_state = get_evaluation_state(session_id)
         evaluation_mode = evaluation_state.get('evaluation_mode', 'single')
         
         if evaluation_mode == 'single':
@@ -344,42 +715,40 @@ def request_browser_summarization(article, session_id):
             configurations = [selected_config]
         else:
             # Use all configurations
-            types = ['tldr', 'key-points', 'teaser', 'headline']
-            lengths = ['short', 'medium', 'long']
-            formats = ['plain-text', 'markdown']
-            configurations = [f"{t}_{l}_{f}" for t in types for l in lengths for f in formats]
+            configurations = ALL_CONFIGURATIONS
         
-        results = []
+        # Emit every request up front so the browser can work on them in parallel.
+        # With several configurations, ROUGE is scored here in one batch rather
+        # than per result in handle_summarization_result.
+        defer_scoring = len(configurations) > 1
+        article_id = article['id']
+        send_article_payload(article, session_id)
+        request_ids = []
         for config in configurations:
-            log_message(f"Requesting {config} summarization for article {article['id']}", session_id)
-            
-            # Create a unique request ID
-            request_suffix = f"_{config}"
-            request_id = f"req_{article['id']}{request_suffix}_{int(time.time())}"
-            
-            # Store the request in the pending requests (session-based)
-            pending_requests = get_pending_requests(session_id)
-            pending_requests[request_id] = {
-                'article': article,
-                'config': config,
-                'result': None,
-                'completed': False,
-                'start_time': time.time()  # Add start time for processing time calculation
-            }
-            save_pending_requests(session_id, pending_requests)
-            
-            # Emit request to browser
-            socketio.emit('summarize_request', {
-                'request_id': request_id,
-                'article_id': article['id'],
-                'text': article['article'],
-                'configuration': config
-            })
-            
-            # Wait for browser response
-            result = wait_for_browser_response(article, config, session_id)
-            if result:
-                results.append(result)
+            log_message(f"Requesting {config} summarization for article {article_id}", session_id)
+            request_ids.append(dispatch_summarize_request(article, config, session_id,
+                                                          defer_scoring=defer_scoring))
+        
+        # Wait for browser responses
+        if evaluation_mode == 'single':
+            responses = [wait_for_browser_response(request_ids[0], session_id)]
+        else:
+            # All requests are already in flight, so wait on them concurrently:
+            # wall time per article is the slowest configuration, not the sum
+            with ThreadPoolExecutor(max_workers=len(request_ids)) as executor:
+                responses = list(executor.map(
+                    lambda request_id: wait_for_browser_response(request_id, session_id),
+                    request_ids
+                ))
+        results = [result for result in responses if result]
+        
+        unscored = [result for result in results if result['rouge_scores'] is None]
+        if unscored:
+            batch_scores = get_evaluator().calculate_rouge_scores_batch(
+                article, [result['generated_summary'] for result in unscored]
+            )
+            for result, rouge_scores in zip(unscored, batch_scores):
+                result['rouge_scores'] = rouge_scores
         
         # Return single result for single mode, list for all mode
         if evaluation_mode == 'single':
@@ -391,7 +760,49 @@ def request_browser_summarization(article, session_id):
         log_message(f"Error processing article {article['id']}: {str(e)}", session_id)
         return []
 
-def wait_for_browser_response(article, config_name=None, session_id=None, timeout=None, max_retries=None):
+def send_article_payload(article, session_id):
+    """Send an article's text to the session's browser once; summarize_request only references it by id"""
+    socketio.emit('article_payload', {
+        'article_id': article['id'],
+        'dataset': article['dataset'],  # IDs are row indexes, unique only within a dataset
+        'text': article['article']
+    }, to=session_id)
+
+def dispatch_summarize_request(article, config_name, session_id, retry_attempt=0, defer_scoring=False):
+    """Register a pending request and emit it to the browser, returning its ID"""
+    # Create a unique request ID
+    # Random ids stay unique across server restarts, so a late reply to a
+    # previous process's request can never match a new one
+    request_id = f"req_{uuid.uuid4().hex[:12]}"
+    
+    # Store the request in the pending requests
+    pending_requests[request_id] = {
+        'session_id': session_id,
+        'article': article,
+        'config': config_name,
+        'result': None,
+        'completed': False,
+        'event': threading.Event(),  # Set by handle_summarization_result
+        'start_time': time.time(),  # Add start time for processing time calculation
+        'retry_attempt': retry_attempt,
+        'defer_scoring': defer_scoring  # ROUGE is computed later in a batch
+    }
+    
+    payload = {
+        'request_id': request_id,
+        'article_id': article['id'],
+        'dataset': article['dataset'],
+        'configuration': config_name
+    }
+    if retry_attempt:
+        # The browser may have reloaded since the first attempt; resend the text
+        send_article_payload(article, session_id)
+        payload['retry_attempt'] = retry_attempt
+    socketio.emit('summarize_request', payload, to=session_id)
+    
+    return request_id
+
+def wait_for_browser_response(request_id, session_id=None, timeout=None, max_retries=None):
     """Wait for browser to return summarization result with retry logic"""
     # Use config values if not specified
     if timeout is None:
@@ -401,69 +812,38 @@ def wait_for_browser_response(article, config_name=None, session_id=None, timeou
     
     retry_delay = getattr(config, 'SUMMARIZER_RETRY_DELAY', 2)
     
+    request_data = pending_requests.get(request_id)
+    if request_data is None:
+        log_message(f"No pending request found for {request_id}", session_id)
+        return None
+    article = request_data['article']
+    config_name = request_data['config']
+    
     for attempt in range(max_retries + 1):  # +1 because we want to include the initial attempt
+        if not connected_clients:
+            # Nobody can answer; don't sit out the timeout
+            pending_requests.pop(request_id, None)
+            log_message(f"No browser connected, using mock result for article {article['id']}, config: {config_name}", session_id)
+            break
+        
         if attempt > 0:
             log_message(f"Retry attempt {attempt}/{max_retries} for article {article['id']}, config: {config_name}", session_id)
-            time.sleep(retry_delay)
+            socketio.sleep(retry_delay)
             
             # Create a new request for the retry
-            request_suffix = f"_{config_name}" if config_name else ""
-            request_id = f"req_{article['id']}{request_suffix}_{int(time.time())}"
-            
-            # Store the retry request
-            pending_requests = get_pending_requests(session_id)
-            pending_requests[request_id] = {
-                'article': article,
-                'config': config_name,
-                'result': None,
-                'completed': False,
-                'start_time': time.time(),
-                'retry_attempt': attempt
-            }
-            save_pending_requests(session_id, pending_requests)
-            
-            # Emit retry request to browser
-            socketio.emit('summarize_request', {
-                'request_id': request_id,
-                'article_id': article['id'],
-                'text': article['article'],
-                'configuration': config_name,
-                'retry_attempt': attempt
-            })
-    
-        # Find the request ID for this article and config
-        request_suffix = f"_{config_name}" if config_name else ""
-        request_key_prefix = f"req_{article['id']}{request_suffix}_"
-    
-        # Find the matching request ID (most recent one)
-        request_id = None
-        pending_requests = get_pending_requests(session_id)
-        matching_requests = [req_id for req_id in pending_requests 
-                           if req_id.startswith(request_key_prefix)]
-        if matching_requests:
-            request_id = max(matching_requests)  # Get the most recent one
-        
-        if not request_id:
-            if attempt == 0:
-                log_message(f"No pending request found for article {article['id']}, config: {config_name}", session_id)
-            continue  # Try next attempt or fall through to mock result
+            request_id = dispatch_summarize_request(article, config_name, session_id, retry_attempt=attempt,
+                                                    defer_scoring=request_data['defer_scoring'])
+            request_data = pending_requests[request_id]
         
-        # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            pending_requests = get_pending_requests(session_id)  # Get fresh session data
-            if request_id in pending_requests and pending_requests[request_id]['completed']:
-                result = pending_requests[request_id]['result']
-                # Don't delete immediately - let it be cleaned up later to avoid duplicates
-                log_message(f"Successfully received response for article {article['id']}, config: {config_name} (attempt {attempt + 1})", session_id)
-                return result
-            time.sleep(0.1)
+        # Block until the browser responds (event is set by handle_summarization_result)
+        if request_data['event'].wait(timeout) and request_data['completed']:
+            result = request_data['result']
+            # Don't delete immediately - let it be cleaned up later to avoid duplicates
+            log_message(f"Successfully received response for article {article['id']}, config: {config_name} (attempt {attempt + 1})", session_id)
+            return result
         
         # Timeout for this attempt
-        pending_requests = get_pending_requests(session_id)
-        if request_id in pending_requests:
-            del pending_requests[request_id]
-            save_pending_requests(session_id, pending_requests)
+        pending_requests.pop(request_id, None)
         
         if attempt < max_retries:
             log_message(f"Timeout on attempt {attempt + 1}/{max_retries + 1} for article {article['id']}, config: {config_name}", session_id)
@@ -473,6 +853,12 @@ def wait_for_browser_response(article, config_name=None, session_id=None, timeou
     # All retries exhausted, return mock result
     return create_mock_result(article, config_name)
 
+@functools.lru_cache(maxsize=4096)
+def mock_rouge_scores(dataset, article_id, reference_summary, mock_summary):
+    """ROUGE scores of a mock summary; memoized since the mock text is deterministic"""
+    article = {'dataset': dataset, 'id': article_id, 'reference_summary': reference_summary}
+    return get_evaluator().calculate_rouge_scores(article, mock_summary)
+
 def create_mock_result(article, config=None):
     """Create mock evaluation result for demonstration"""
     # Mock browser summary (used as fallback when browser API fails)
@@ -480,10 +866,8 @@ def create_mock_result(article, config=None):
     mock_summary = f"This article discusses key topics related to article {article['id']}{config_desc}. The main points cover important aspects of the subject matter."
     
     # Calculate ROUGE scores
-    rouge_scores = evaluator.calculate_rouge_scores(
-        article['reference_summary'], 
-        mock_summary
-    )
+    rouge_scores = dict(mock_rouge_scores(article['dataset'], article['id'],
+                                          article['reference_summary'], mock_summary))
     
     # Calculate compression ratio
     article_length = len(article['article'])
@@ -502,36 +886,79 @@ def create_mock_result(article, config=None):
         'rouge_scores': rouge_scores,
         'compression_ratio': compression_ratio,
         'processing_time': processing_time,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': current_timestamps()[1],
         'source': 'mock_fallback'
     }
 
+_timestamps = (None, '', '')  # (epoch second, "HH:MM:SS", ISO 8601) of the last format
+
+def current_timestamps():
+    """Local time as ("HH:MM:SS", ISO 8601), formatted at most once per second"""
+    global _timestamps
+    second = int(time.time())
+    if _timestamps[0] != second:
+        now = datetime.fromtimestamp(second)
+        # One tuple assignment, so concurrent callers never see a mixed pair
+        _timestamps = (second, now.strftime("%H:%M:%S"), now.isoformat(timespec='seconds'))
+    return _timestamps[1:]
+
 def log_message(message, session_id=None):
     """Add message to logs"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    timestamp = current_timestamps()[0]
     log_entry = f"[{timestamp}] {message}"
     
     if session_id:
-        evaluation_state = get_evaluation_state(session_id)
-        evaluation_state['logs'].append(log_entry)
-        save_evaluation_state(session_id, evaluation_state)
+        # Bounded deque on the live state; no save round trip needed
+        get_evaluation_state(session_id)['logs'].append(log_entry)
     
     logger.info(message)
     try:
-        socketio.emit('log_update', {'message': log_entry})
-    except RuntimeError:
-        # Outside request context, can't emit
+        log_queue.put_nowait(log_entry)
+    except queue.Full:
+        # Client is far behind; the entry is still kept in the session logs
         pass
 
+def flush_log_queue():
+    """Drain queued log entries and emit them as batched 'log_update' events"""
+    while True:
+        socketio.sleep(config.LOG_FLUSH_INTERVAL_MS / 1000)
+        messages = []
+        while True:
+            try:
+                messages.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            socketio.emit('log_update', {'messages': messages})
+
+_log_flusher_started = False
+_log_flusher_lock = threading.Lock()
+
+def start_log_flusher():
+    """Start the log flusher task once, on the first client connection.
+    
+    Starting it at import time would also start it in every spawned worker
+    process that re-imports this module.
+    """
+    global _log_flusher_started
+    with _log_flusher_lock:
+        if not _log_flusher_started:
+            socketio.start_background_task(flush_log_queue)
+            _log_flusher_started = True
+
 @socketio.on('connect')
 def handle_connect():
+    start_log_flusher()
+    connected_clients.add(request.sid)
     session_id = get_session_id()
+    join_room(session_id)  # Session-scoped events such as export_ready go to this room
     log_message("Client connected", session_id)
     evaluation_state = get_evaluation_state(session_id)
-    emit('status_update', evaluation_state)
+    emit('status_update', serialize_evaluation_state(evaluation_state))
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    connected_clients.discard(request.sid)
     try:
         session_id = get_session_id()
         log_message("Client disconnected", session_id)
@@ -547,30 +974,24 @@ def handle_summarization_result(data):
     generated_summary = data.get('summary', '')
     error_message = data.get('error')
     
-    # Extract session_id from request_id or use current session
-    try:
-        session_id = get_session_id()
-    except RuntimeError:
-        # Fallback - extract from request_id if possible
-        session_id = None
-    
     # Check if this request has already been processed to avoid duplicates
-    pending_requests = get_pending_requests(session_id)
-    if request_id not in pending_requests:
-        log_message(f"Received duplicate or unknown request {request_id} for article {article_id}, ignoring", session_id)
+    request_data = pending_requests.get(request_id)
+    if request_data is None:
+        log_message(f"Received duplicate or unknown request {request_id} for article {article_id}, ignoring")
         emit('summarization_acknowledged', {'request_id': request_id, 'article_id': article_id})
         return
     
+    # The pending request knows which evaluation session it belongs to
+    session_id = request_data['session_id']
+    
     # Check if already completed
-    if pending_requests[request_id].get('completed', False):
+    if request_data.get('completed', False):
         log_message(f"Request {request_id} for article {article_id} already completed, ignoring duplicate", session_id)
         emit('summarization_acknowledged', {'request_id': request_id, 'article_id': article_id})
         return
     
     log_message(f"Received summarization for article {article_id} (request: {request_id})", session_id)
     
-    # Find the pending request in session store
-    request_data = pending_requests[request_id]
     article = request_data['article']
     config = request_data.get('config')
     
@@ -582,11 +1003,11 @@ def handle_summarization_result(data):
         log_message(f"Error in browser summarization: {error_message}", session_id)
         result = create_mock_result(article, config)  # Fallback to mock
     else:
-        # Calculate actual ROUGE scores with browser summary
-        rouge_scores = evaluator.calculate_rouge_scores(
-            article['reference_summary'], 
-            generated_summary
-        )
+        # Calculate actual ROUGE scores with browser summary (unless batched later)
+        if request_data.get('defer_scoring'):
+            rouge_scores = None
+        else:
+            rouge_scores = get_evaluator().calculate_rouge_scores(article, generated_summary)
         
         # Calculate compression ratio
         article_length = len(article['article'])
@@ -602,15 +1023,17 @@ def handle_summarization_result(data):
             'rouge_scores': rouge_scores,
             'compression_ratio': compression_ratio,
             'processing_time': processing_time,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': current_timestamps()[1],
             'source': 'browser_api'
         }
     
     # Mark as completed
     request_data['result'] = result
     request_data['completed'] = True
-    pending_requests[request_id] = request_data
-    save_pending_requests(session_id, pending_requests)
+    completed_requests.setdefault(session_id, set()).add(request_id)
+    
+    # Wake up the evaluation task waiting on this request
+    request_data['event'].set()
     
     emit('summarization_acknowledged', {'request_id': request_id, 'article_id': article_id})
 
@@ -2,6 +2,8 @@
 Production configuration for Azure deployment.
 """
 
+import functools
+import json
 import os
 
 # Server Configuration
@@ -69,10 +71,12 @@ DATASET_SPLIT = None
 MAX_ARTICLE_LENGTH = 4000
 DEFAULT_MAX_ARTICLES = 10   # Reduced for production
 MAX_ALLOWED_ARTICLES = 25   # Reduced for production
+DATASET_STREAMING = True  # Stream splits; avoids multi-GB downloads on App Service
 
 # Evaluation Configuration
 ROUGE_METRICS = ['rouge1', 'rouge2', 'rougeL']
 USE_STEMMER = True
+ROUGE_WORKERS = 2  # Processes for ROUGE scoring (small App Service plans)
 SUMMARIZER_TIMEOUT = 240  # Increased timeout for production
 SUMMARIZER_MAX_RETRIES = 2  # Retry up to 2 times on timeout
 SUMMARIZER_RETRY_DELAY = 5  # Wait 5 seconds between retries
@@ -91,62 +95,20 @@ EXPORT_FILENAME_FORMAT = 'summarization_results_{timestamp}.csv'
 
 # UI Configuration
 LOG_MAX_ENTRIES = 500  # Reduced for production
-PROGRESS_UPDATE_INTERVAL = 2
+LOG_FLUSH_INTERVAL_MS = 100  # Log lines are sent to the browser in batches this often
+PROGRESS_UPDATE_INTERVAL = 2  # Minimum seconds per article (paces requests to the browser API)
+MAX_CONCURRENT_ARTICLES = 2  # Articles evaluated in parallel by the browser
+PROGRESS_FLUSH_EVERY = 8  # Coalesce this many progress events into one Socket.IO emit
+PROGRESS_FLUSH_INTERVAL_MS = 250  # Flush pending progress events at least this often
+PROGRESS_THROTTLE_MS = 100  # Minimum spacing between progress_update events
+SESSION_CACHE_SIZE = 256  # Maximum sessions whose state is kept in memory
+SESSION_TTL_SECONDS = 3600  # Idle session state is dropped after this long
 
-# Sample Articles (same as development)
-SAMPLE_ARTICLES = [
-    {
-        'id': 1,
-        'article': """
-        The tech industry has seen remarkable growth in artificial intelligence applications over the past year. 
-        Companies are investing billions of dollars in AI research and development, with particular focus on 
-        large language models and computer vision technologies. Major tech giants like Google, Microsoft, 
-        and OpenAI are leading the charge in developing more sophisticated AI systems that can understand 
-        and generate human-like text, analyze images, and even write code. This rapid advancement has sparked 
-        both excitement about the potential benefits and concerns about the ethical implications of AI technology. 
-        Experts predict that AI will continue to transform various industries, from healthcare and finance 
-        to education and entertainment, in the coming years. The investment in AI infrastructure has reached 
-        unprecedented levels, with venture capital funding flowing into AI startups at record rates. 
-        However, concerns about job displacement, privacy, and the concentration of AI power in a few 
-        large corporations continue to grow among policymakers and the general public.
-        """,
-        'reference_summary': "Tech industry invests billions in AI development, with major companies leading advancement in language models and computer vision, raising both opportunities and ethical concerns about job displacement and corporate concentration."
-    },
-    {
-        'id': 2,
-        'article': """
-        Climate change continues to be one of the most pressing global challenges of our time. Scientists 
-        worldwide are reporting unprecedented changes in weather patterns, rising sea levels, and increasing 
-        temperatures. The latest IPCC report highlights the urgent need for immediate action to reduce 
-        greenhouse gas emissions and transition to renewable energy sources. Many countries have committed 
-        to achieving net-zero emissions by 2050, but experts argue that current efforts are insufficient 
-        to limit global warming to 1.5 degrees Celsius above pre-industrial levels. The report emphasizes 
-        the importance of international cooperation and coordinated efforts to address this global crisis.
-        Renewable energy technologies like solar and wind have become increasingly cost-competitive with 
-        fossil fuels, leading to rapid adoption in many regions. However, the transition requires massive 
-        infrastructure investments and significant changes to energy systems worldwide. The economic 
-        implications of climate action are substantial, but economists argue that the cost of inaction 
-        would be far greater, potentially leading to trillions in damages from extreme weather events, 
-        agricultural disruption, and mass migration.
-        """,
-        'reference_summary': "Scientists report urgent climate crisis requiring immediate action to reduce emissions and transition to renewable energy, with current efforts insufficient to meet warming targets despite growing renewable adoption and economic imperatives."
-    },
-    {
-        'id': 3,
-        'article': """
-        The global supply chain disruptions that began during the COVID-19 pandemic continue to affect 
-        businesses and consumers worldwide. Shipping delays, semiconductor shortages, and labor constraints 
-        have forced companies to rethink their supply chain strategies. Many organizations are now focusing 
-        on building more resilient and diversified supply networks rather than optimizing purely for cost 
-        efficiency. The semiconductor shortage has particularly impacted the automotive industry, with 
-        major manufacturers forced to halt production at various facilities. This has led to increased 
-        prices for new vehicles and longer wait times for consumers. Experts suggest that supply chain 
-        normalization may take several more years, as companies work to rebuild inventory levels and 
-        establish more stable supplier relationships. The crisis has also accelerated adoption of digital 
-        supply chain technologies, including AI-powered demand forecasting and blockchain-based tracking 
-        systems. Companies are investing heavily in supply chain visibility tools to better anticipate 
-        and respond to future disruptions.
-        """,
-        'reference_summary': "COVID-19 pandemic triggered ongoing global supply chain disruptions affecting businesses worldwide, forcing companies to prioritize resilience over cost efficiency while investing in digital tracking and forecasting technologies."
-    }
-]
+# Sample Articles (same as development), read from config_samples.json on first use
+SAMPLE_ARTICLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config_samples.json')
+
+@functools.lru_cache(maxsize=1)
+def get_sample_articles():
+    """Load the fallback sample articles (once per process)"""
+    with open(SAMPLE_ARTICLES_FILE, encoding='utf-8') as f:
+        return json.load(f)
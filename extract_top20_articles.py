@@ -7,209 +7,404 @@ that pass the length filter. Supports all datasets configured in config.py.
 
 import json
 import argparse
+import csv
+import functools
 import os
-from datasets import load_dataset
+import sys
+from pathlib import Path
 
-# Configuration from config.py - all available datasets
+import config
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+# Dataset definitions and the length filter come from config.py (shared with
+# app.py); the built-in 'sample' entry has no HuggingFace split to extract from
 AVAILABLE_DATASETS = {
-    'cnn_dailymail': {
-        'name': 'CNN/DailyMail',
-        'dataset_name': 'cnn_dailymail',
-        'version': '3.0.0',
-        'split': 'test',
-        'article_field': 'article',
-        'summary_field': 'highlights',
-        'description': 'News articles with human-written summaries'
-    },
-    'xsum': {
-        'name': 'XSum (BBC)',
-        'dataset_name': 'xsum',
-        'version': None,
-        'split': 'test',
-        'article_field': 'document',
-        'summary_field': 'summary',
-        'description': 'BBC articles with single-sentence summaries'
-    },
-    'reddit_tifu': {
-        'name': 'Reddit TIFU',
-        'dataset_name': 'reddit_tifu',
-        'version': 'long',
-        'split': 'test',
-        'article_field': 'documents',
-        'summary_field': 'tldr',
-        'description': 'Reddit posts with TL;DR summaries'
-    },
-    'multi_news': {
-        'name': 'Multi-News',
-        'dataset_name': 'multi_news',
-        'version': None,
-        'split': 'test',
-        'article_field': 'document',
-        'summary_field': 'summary',
-        'description': 'Multi-document news summarization'
-    }
+    key: dataset_config
+    for key, dataset_config in config.AVAILABLE_DATASETS.items()
+    if key != 'sample'
 }
+MAX_ARTICLE_LENGTH = config.MAX_ARTICLE_LENGTH
+
+# Dataset keys, for argparse choices and membership checks
+DATASET_KEYS = tuple(AVAILABLE_DATASETS)
+DATASET_KEYSET = frozenset(DATASET_KEYS)
+
+# Progress lines are written to stdout in batches of this many articles
+PROGRESS_BATCH = 10
+
+# Rules used in the readable text output
+SEP = "=" * 100
+DASH = "-" * 100
+
+# Flattens article previews onto one line (and one TSV field)
+NEWLINE_TABLE = str.maketrans('\n\r\t', '   ')
+
+# Output goes to the results folder next to this script (same folder as app.py),
+# and filtered articles are cached there so repeat runs skip loading the split
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+CACHE_DIR = RESULTS_DIR / '.cache'
 
-MAX_ARTICLE_LENGTH = 4000
 
-def extract_articles(dataset_key='cnn_dailymail', max_articles=20):
-    """Extract articles from specified dataset."""
+@functools.lru_cache(maxsize=None)
+def ensure_dir(path):
+    """Create a directory (once per process) and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def load_split(dataset_key, streaming=False):
+    """Load a dataset split once per process (same as app.py).
     
-    if dataset_key not in AVAILABLE_DATASETS:
-        print(f"❌ Error: Unknown dataset '{dataset_key}'")
-        print(f"Available datasets: {', '.join(AVAILABLE_DATASETS.keys())}")
-        return []
+    With streaming=True an IterableDataset limited to the article and summary
+    fields is returned, so nothing is downloaded up front and unused columns
+    are never decoded.
+    """
+    # Imported here so --list and argument errors don't pay for datasets/Arrow
+    from datasets import load_dataset
     
     dataset_config = AVAILABLE_DATASETS[dataset_key]
-    
-    print(f"Dataset: {dataset_config['name']}")
-    print(f"Description: {dataset_config['description']}")
-    print(f"Loading {dataset_config['dataset_name']} ", end="")
-    if dataset_config['version']:
-        print(f"version {dataset_config['version']} ", end="")
-    print(f"({dataset_config['split']} split)...")
-    print(f"Filtering articles with length < {MAX_ARTICLE_LENGTH} characters")
-    print(f"Target: {max_articles} articles")
-    print("-" * 80)
-    
-    # Load dataset (same as app.py)
     if dataset_config['version']:
         dataset = load_dataset(
             dataset_config['dataset_name'], 
             dataset_config['version'], 
-            split=dataset_config['split']
+            split=dataset_config['split'],
+            streaming=streaming
         )
     else:
         dataset = load_dataset(
             dataset_config['dataset_name'], 
-            split=dataset_config['split']
+            split=dataset_config['split'],
+            streaming=streaming
         )
+    if streaming:
+        dataset = dataset.select_columns([dataset_config['article_field'],
+                                          dataset_config['summary_field']])
+    return dataset
+
+
+def hf_datasets_cache_dir():
+    """HuggingFace datasets cache folder, resolved the same way datasets does."""
+    if os.environ.get('HF_DATASETS_CACHE'):
+        return Path(os.environ['HF_DATASETS_CACHE']).expanduser()
+    hf_home = os.environ.get('HF_HOME', os.path.join(
+        os.environ.get('XDG_CACHE_HOME', '~/.cache'), 'huggingface'))
+    return Path(hf_home).expanduser() / 'datasets'
+
+
+def enable_offline_mode(dataset_key):
+    """Set HF_DATASETS_OFFLINE when the split is already in the local cache.
+    
+    Must run before datasets is imported. Returns True if offline mode was enabled.
+    """
+    cache_dir = hf_datasets_cache_dir()
+    dataset_name = AVAILABLE_DATASETS[dataset_key]['dataset_name']
+    # Hub datasets are cached as '<owner>___<name>', script datasets as '<name>'
+    if not cache_dir.is_dir() or not any(cache_dir.glob(f"*{dataset_name}")):
+        return False
+    os.environ['HF_DATASETS_OFFLINE'] = '1'
+    return True
+
+
+def cache_path(dataset_key):
+    """Parquet file caching a dataset's articles under MAX_ARTICLE_LENGTH."""
+    return CACHE_DIR / f"{dataset_key}_lt{MAX_ARTICLE_LENGTH}.parquet"
+
+
+def read_cached_articles(dataset_key, max_articles):
+    """Return the first `max_articles` cached rows, or None if the cache can't serve them."""
+    path = cache_path(dataset_key)
+    if not path.exists():
+        return None
+    import pyarrow.parquet as pq
+    table = pq.read_table(path, memory_map=True)
+    if table.num_rows < max_articles:
+        return None
+    return table.slice(0, max_articles).to_pylist()
+
+
+def write_cached_articles(dataset_key, articles):
+    """Cache extracted articles (in dataset order) for later runs."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    ensure_dir(CACHE_DIR)
+    table = pa.table({
+        'index': [article['index'] for article in articles],
+        'article': [article['article'] for article in articles],
+        'reference_summary': [article['reference_summary'] for article in articles]
+    })
+    pq.write_table(table, cache_path(dataset_key))
+
+
+def text_column(column):
+    """Arrow string column for a dataset field; list-typed (segmented) values are space-joined."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    if pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+        return pc.binary_join(column, ' ')
+    return column
+
+
+def as_text(value):
+    """Join list-typed dataset fields (e.g. segmented articles) into one string."""
+    return ' '.join(value) if isinstance(value, list) else value
+
+
+def text_converter(features, field):
+    """Per-row string conversion for a field, picked once from the dataset features.
+    
+    Falls back to the per-value as_text check when the features are unknown
+    (some streamed datasets don't declare them). Null values stay None.
+    """
+    from datasets import Sequence, Value
+    
+    feature = features.get(field) if features else None
+    if isinstance(feature, Sequence):
+        return lambda value: None if value is None else ' '.join(value)
+    if isinstance(feature, Value):
+        return lambda value: value  # Already a string (or None)
+    return as_text
+
+
+def new_length_stats():
+    """Running min/max/sum of article and summary lengths."""
+    return {
+        'article_min': float('inf'), 'article_max': 0, 'article_sum': 0,
+        'summary_min': float('inf'), 'summary_max': 0, 'summary_sum': 0
+    }
+
+
+def flush_progress(progress):
+    """Write buffered progress lines to stdout in one call."""
+    if progress:
+        sys.stdout.write('\n'.join(progress) + '\n')
+        progress.clear()
+
+
+def add_article(filtered_articles, stats, progress, index, article_text, summary_text, dataset_key):
+    """Append an extracted article, update the length stats and buffer its progress line."""
+    article_length = len(article_text)
+    summary_length = len(summary_text)
+    stats['article_min'] = min(stats['article_min'], article_length)
+    stats['article_max'] = max(stats['article_max'], article_length)
+    stats['article_sum'] += article_length
+    stats['summary_min'] = min(stats['summary_min'], summary_length)
+    stats['summary_max'] = max(stats['summary_max'], summary_length)
+    stats['summary_sum'] += summary_length
+    
+    filtered_articles.append({
+        'index': index,  # Original index in dataset
+        'eval_id': len(filtered_articles),  # ID used in evaluation (0-19)
+        'article': article_text,
+        'reference_summary': summary_text,
+        'article_length': article_length,
+        'summary_length': summary_length,
+        'dataset': dataset_key
+    })
+    
+    # Print progress (every PROGRESS_BATCH articles)
+    progress.append(f"Article {len(filtered_articles):2d}: Index {index:5d} | "
+                    f"Length: {article_length:4d} chars | "
+                    f"Summary: {summary_length:3d} chars")
+    if len(progress) >= PROGRESS_BATCH:
+        flush_progress(progress)
+
+
+def stream_articles(filtered_articles, stats, progress, dataset_key, max_articles):
+    """Add articles from a streamed split, stopping early; returns the rows read."""
+    dataset_config = AVAILABLE_DATASETS[dataset_key]
+    dataset = load_split(dataset_key, streaming=True)
+    
+    print(f"Streaming articles...")
+    print("-" * 80)
+    
+    article_field = dataset_config['article_field']
+    summary_field = dataset_config['summary_field']
+    article_as_text = text_converter(dataset.features, article_field)
+    summary_as_text = text_converter(dataset.features, summary_field)
+    
+    processed_count = 0
+    for i, example in enumerate(dataset):
+        if len(filtered_articles) >= max_articles:
+            break
+        processed_count += 1
+        # Rows with a null article or summary are skipped, as in filter_articles
+        article_text = article_as_text(example[article_field])
+        if article_text is None or len(article_text) >= MAX_ARTICLE_LENGTH:
+            continue
+        summary_text = summary_as_text(example[summary_field])
+        if summary_text is not None:
+            add_article(filtered_articles, stats, progress, i, article_text, summary_text, dataset_key)
+    return processed_count
+
+
+def filter_articles(filtered_articles, stats, progress, dataset_key, max_articles):
+    """Add articles from a fully loaded split; returns the rows scanned."""
+    dataset_config = AVAILABLE_DATASETS[dataset_key]
+    
+    # Load dataset (same as app.py)
+    dataset = load_split(dataset_key)
     
     print(f"Total articles in dataset: {len(dataset)}")
     print(f"Starting extraction...")
     print("-" * 80)
     
-    # Filter articles (same logic as app.py)
+    # Filter articles (same logic as app.py), vectorized over the Arrow table:
+    # only the kept rows are ever converted to Python strings
+    import pyarrow.compute as pc
+    
+    table = dataset.data.table
+    articles = text_column(table.column(dataset_config['article_field']))
+    summaries = text_column(table.column(dataset_config['summary_field']))
+    
+    # Null articles compare as null and are dropped; null summaries are dropped too
+    short_enough = pc.and_(pc.less(pc.utf8_length(articles), MAX_ARTICLE_LENGTH),
+                           pc.is_valid(summaries))
+    kept = pc.indices_nonzero(short_enough).slice(0, max_articles)
+    
+    for i, article_text, summary_text in zip(kept.to_pylist(),
+                                             articles.take(kept).to_pylist(),
+                                             summaries.take(kept).to_pylist()):
+        add_article(filtered_articles, stats, progress, i, article_text, summary_text, dataset_key)
+    
+    # Rows up to the last kept article (the whole split if it ran short)
+    if 0 < len(kept) == max_articles:
+        return kept[-1].as_py() + 1
+    return len(table)
+
+
+def extract_articles(dataset_key='cnn_dailymail', max_articles=20, streaming=False):
+    """Extract articles from specified dataset.
+    
+    Returns (articles, stats), where stats holds the length statistics
+    gathered while extracting. With streaming=True the split is read row by
+    row and reading stops as soon as `max_articles` articles have been found.
+    """
+    
+    if dataset_key not in DATASET_KEYSET:
+        print(f"❌ Error: Unknown dataset '{dataset_key}'")
+        print(f"Available datasets: {', '.join(DATASET_KEYS)}")
+        return [], None
+    
+    dataset_config = AVAILABLE_DATASETS[dataset_key]
+    
+    print(f"Dataset: {dataset_config['name']}")
+    print(f"Description: {dataset_config['description']}")
+    print(f"Loading {dataset_config['dataset_name']} ", end="")
+    if dataset_config['version']:
+        print(f"version {dataset_config['version']} ", end="")
+    print(f"({dataset_config['split']} split)...")
+    print(f"Filtering articles with length < {MAX_ARTICLE_LENGTH} characters")
+    print(f"Target: {max_articles} articles")
+    print("-" * 80)
+    
     filtered_articles = []
-    skipped_count = 0
-    for i, article in enumerate(dataset):
-        article_text = article[dataset_config['article_field']]
-        summary_text = article[dataset_config['summary_field']]
-        
-        # Handle different data types (string vs list)
-        if isinstance(article_text, list):
-            article_text = ' '.join(article_text)
-        if isinstance(summary_text, list):
-            summary_text = ' '.join(summary_text)
-        
-        # Skip if article is too long
-        if len(article_text) >= MAX_ARTICLE_LENGTH:
-            skipped_count += 1
-            continue
-            
-        if len(filtered_articles) < max_articles:
-            filtered_articles.append({
-                'index': i,  # Original index in dataset
-                'eval_id': len(filtered_articles),  # ID used in evaluation (0-19)
-                'article': article_text,
-                'reference_summary': summary_text,
-                'article_length': len(article_text),
-                'summary_length': len(summary_text),
-                'dataset': dataset_key
-            })
-            
-            # Print progress
-            print(f"Article {len(filtered_articles):2d}: Index {i:5d} | "
-                  f"Length: {len(article_text):4d} chars | "
-                  f"Summary: {len(summary_text):3d} chars")
-        else:
-            # We have enough articles, stop processing
-            break
+    stats = new_length_stats()
+    progress = []
+    cached = read_cached_articles(dataset_key, max_articles)
+    if cached is not None:
+        print(f"Using cached articles from {cache_path(dataset_key)}")
+        print("-" * 80)
+        for row in cached:
+            add_article(filtered_articles, stats, progress, row['index'], row['article'],
+                        row['reference_summary'], dataset_key)
+        flush_progress(progress)
+        print("-" * 80)
+        print(f"Extracted {len(filtered_articles)} articles")
+        return filtered_articles, stats
     
+    if streaming:
+        processed_count = stream_articles(filtered_articles, stats, progress, dataset_key, max_articles)
+    else:
+        processed_count = filter_articles(filtered_articles, stats, progress, dataset_key, max_articles)
+    skipped_count = processed_count - len(filtered_articles)
+    
+    flush_progress(progress)
     print("-" * 80)
     print(f"Extracted {len(filtered_articles)} articles")
     print(f"Skipped {skipped_count} articles (too long: >= {MAX_ARTICLE_LENGTH} chars)")
-    print(f"Processed {i + 1} total articles from dataset")
+    print(f"Processed {processed_count} total articles from dataset")
     
-    return filtered_articles
+    write_cached_articles(dataset_key, filtered_articles)
+    return filtered_articles, stats
 
 
-def save_articles_to_files(articles, dataset_key, max_articles):
-    """Save articles to separate text and JSON files."""
+def save_articles_to_files(articles, dataset_key, max_articles, output_format='json'):
+    """Save articles to JSON and/or readable text files, plus a TSV overview.
+    
+    output_format is 'json', 'text' or 'all'.
+    """
     
     dataset_name = AVAILABLE_DATASETS[dataset_key]['name']
     filename_prefix = f"{dataset_key}_top{max_articles}"
     
     # Create results directory if it doesn't exist
-    results_dir = os.path.join(os.getcwd(), 'results')
-    os.makedirs(results_dir, exist_ok=True)
+    results_dir = ensure_dir(RESULTS_DIR)
     
     # Save as JSON with all metadata
-    json_path = os.path.join(results_dir, f'{filename_prefix}_articles.json')
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, indent=2, ensure_ascii=False)
-    print(f"\n✅ Saved JSON to: {json_path}")
+    if output_format in ('json', 'all'):
+        json_path = results_dir / f'{filename_prefix}_articles.json'
+        if orjson is not None:
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(articles, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Saved JSON to: {json_path}")
     
     # Save as readable text file
-    text_path = os.path.join(results_dir, f'{filename_prefix}_articles.txt')
-    with open(text_path, 'w', encoding='utf-8') as f:
-        f.write("=" * 100 + "\n")
-        f.write(f"TOP {max_articles} ARTICLES FROM {dataset_name.upper()} DATASET\n")
-        f.write("=" * 100 + "\n\n")
-        
-        for article in articles:
-            f.write(f"\n{'='*100}\n")
-            f.write(f"ARTICLE {article['eval_id'] + 1} (Dataset Index: {article['index']})\n")
-            f.write(f"{'='*100}\n\n")
-            
-            f.write(f"Article Length: {article['article_length']} characters\n")
-            f.write(f"Summary Length: {article['summary_length']} characters\n\n")
-            
-            f.write("ARTICLE TEXT:\n")
-            f.write("-" * 100 + "\n")
-            f.write(article['article'])
-            f.write("\n" + "-" * 100 + "\n\n")
-            
-            f.write("REFERENCE SUMMARY (HIGHLIGHTS):\n")
-            f.write("-" * 100 + "\n")
-            f.write(article['reference_summary'])
-            f.write("\n" + "-" * 100 + "\n\n")
-    
-    print(f"✅ Saved readable text to: {text_path}")
-    
-    # Save summaries of each article
-    summary_path = os.path.join(results_dir, f'{filename_prefix}_articles_summary.txt')
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write(f"SUMMARY OF TOP {max_articles} ARTICLES - {dataset_name.upper()}\n")
-        f.write("=" * 100 + "\n\n")
-        
+    if output_format in ('text', 'all'):
+        text_path = results_dir / f'{filename_prefix}_articles.txt'
+        chunks = [f"{SEP}\nTOP {max_articles} ARTICLES FROM {dataset_name.upper()} DATASET\n{SEP}\n\n"]
         for article in articles:
-            f.write(f"{article['eval_id'] + 1:2d}. Index {article['index']:5d} | "
-                   f"Length: {article['article_length']:4d} chars | "
-                   f"Summary: {article['summary_length']:3d} chars\n")
-            f.write(f"    First 150 chars: {article['article'][:150].replace(chr(10), ' ')}...\n\n")
+            chunks.append(
+                f"\n{SEP}\n"
+                f"ARTICLE {article['eval_id'] + 1} (Dataset Index: {article['index']})\n"
+                f"{SEP}\n\n"
+                f"Article Length: {article['article_length']} characters\n"
+                f"Summary Length: {article['summary_length']} characters\n\n"
+                f"ARTICLE TEXT:\n{DASH}\n{article['article']}\n{DASH}\n\n"
+                f"REFERENCE SUMMARY (HIGHLIGHTS):\n{DASH}\n{article['reference_summary']}\n{DASH}\n\n"
+            )
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write("".join(chunks))
+        print(f"✅ Saved readable text to: {text_path}")
+    
+    # Save a tab-separated overview of each article
+    summary_path = results_dir / f'{filename_prefix}_articles_summary.tsv'
+    with open(summary_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, delimiter='\t')
+        writer.writerow(['eval_id', 'index', 'article_length', 'summary_length', 'first_150_chars'])
+        writer.writerows(
+            (article['eval_id'], article['index'], article['article_length'],
+             article['summary_length'], article['article'][:150].translate(NEWLINE_TABLE))
+            for article in articles
+        )
     
     print(f"✅ Saved article summary to: {summary_path}")
 
 
-def print_statistics(articles):
-    """Print statistics about the articles."""
-    
-    article_lengths = [a['article_length'] for a in articles]
-    summary_lengths = [a['summary_length'] for a in articles]
+def print_statistics(articles, stats):
+    """Print statistics about the articles (from the stats gathered during extraction)."""
     
     print("\n" + "=" * 80)
     print("STATISTICS")
     print("=" * 80)
     print(f"Total articles: {len(articles)}")
     print(f"\nArticle lengths:")
-    print(f"  Min: {min(article_lengths)} chars")
-    print(f"  Max: {max(article_lengths)} chars")
-    print(f"  Avg: {sum(article_lengths) / len(article_lengths):.1f} chars")
+    print(f"  Min: {stats['article_min']} chars")
+    print(f"  Max: {stats['article_max']} chars")
+    print(f"  Avg: {stats['article_sum'] / len(articles):.1f} chars")
     print(f"\nSummary lengths:")
-    print(f"  Min: {min(summary_lengths)} chars")
-    print(f"  Max: {max(summary_lengths)} chars")
-    print(f"  Avg: {sum(summary_lengths) / len(summary_lengths):.1f} chars")
+    print(f"  Min: {stats['summary_min']} chars")
+    print(f"  Max: {stats['summary_max']} chars")
+    print(f"  Avg: {stats['summary_sum'] / len(articles):.1f} chars")
     print("=" * 80)
 
 
@@ -218,14 +413,14 @@ def list_available_datasets():
     print("\n" + "=" * 80)
     print("AVAILABLE DATASETS")
     print("=" * 80)
-    for key, config in AVAILABLE_DATASETS.items():
+    for key, dataset_config in AVAILABLE_DATASETS.items():
         print(f"\n{key}:")
-        print(f"  Name: {config['name']}")
-        print(f"  Description: {config['description']}")
-        print(f"  Dataset: {config['dataset_name']}")
-        if config['version']:
-            print(f"  Version: {config['version']}")
-        print(f"  Split: {config['split']}")
+        print(f"  Name: {dataset_config['name']}")
+        print(f"  Description: {dataset_config['description']}")
+        print(f"  Dataset: {dataset_config['dataset_name']}")
+        if dataset_config['version']:
+            print(f"  Version: {dataset_config['version']}")
+        print(f"  Split: {dataset_config['split']}")
     print("\n" + "=" * 80)
 
 
@@ -244,6 +439,15 @@ Examples:
   # Extract 10 articles from Reddit TIFU
   python extract_top20_articles.py -d reddit_tifu -c 10
   
+  # Also write the human-readable text file
+  python extract_top20_articles.py --format all
+  
+  # Stream the split instead of downloading it first
+  python extract_top20_articles.py --stream
+  
+  # Skip the HuggingFace Hub check when the dataset is already cached locally
+  python extract_top20_articles.py --offline
+  
   # List all available datasets
   python extract_top20_articles.py --list
         """
@@ -253,7 +457,7 @@ Examples:
         '-d', '--dataset',
         type=str,
         default='cnn_dailymail',
-        choices=list(AVAILABLE_DATASETS.keys()),
+        choices=DATASET_KEYS,
         help='Dataset to extract from (default: cnn_dailymail)'
     )
     
@@ -264,6 +468,28 @@ Examples:
         help='Number of articles to extract (default: 20)'
     )
     
+    parser.add_argument(
+        '-f', '--format',
+        choices=('json', 'text', 'all'),
+        default='json',
+        help='Which article files to write: JSON, readable text, or both '
+             '(default: json; the TSV overview is always written)'
+    )
+    
+    parser.add_argument(
+        '-s', '--stream',
+        action='store_true',
+        help='Stream the dataset and stop once enough articles are found '
+             '(no full download)'
+    )
+    
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Set HF_DATASETS_OFFLINE=1 when the dataset is already in the local '
+             'HuggingFace cache, skipping the Hub revision check on warm runs'
+    )
+    
     parser.add_argument(
         '-l', '--list',
         action='store_true',
@@ -283,19 +509,26 @@ Examples:
         print("=" * 80)
         print()
         
+        # Streaming always reads from the Hub, so --offline only applies to full loads
+        if args.offline and not args.stream:
+            if enable_offline_mode(args.dataset):
+                print(f"Offline mode: using the local HuggingFace cache ({hf_datasets_cache_dir()})\n")
+            else:
+                print("Dataset not found in the local HuggingFace cache; loading online\n")
+        
         # Extract articles
-        articles = extract_articles(args.dataset, args.count)
+        articles, stats = extract_articles(args.dataset, args.count, streaming=args.stream)
         
         if not articles:
             print("\n❌ No articles extracted. Exiting.")
             exit(1)
         
         # Print statistics
-        print_statistics(articles)
+        print_statistics(articles, stats)
         
         # Save to files
         print("\nSaving articles to files...")
-        save_articles_to_files(articles, args.dataset, args.count)
+        save_articles_to_files(articles, args.dataset, args.count, args.format)
         
         print("\n✅ Done! Check the results folder for the extracted articles.")
         print(f"   Files saved with prefix: {args.dataset}_top{args.count}_articles.*")
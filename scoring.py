@@ -0,0 +1,293 @@
+"""
+ROUGE scoring helpers for the Browser Summarization Quality Evaluation project.
+"""
+
+import functools
+import re
+
+import numpy as np
+from rouge_score import rouge_scorer, tokenizers
+from rouge_score import scoring as rouge_scoring
+from rouge_score import tokenize as rouge_tokenize
+
+try:
+    from rouge_score_rs import rouge_scorer as native_rouge_scorer
+except ImportError:  # pure-Python rouge_score path below is used instead
+    native_rouge_scorer = None
+
+
+def ngram_counts(tokens, n):
+    """Sorted unique n-gram hashes (int64) and their counts for a token list"""
+    ngram_total = max(len(tokens) - n + 1, 0)
+    hashes = np.fromiter(
+        (hash(ngram) for ngram in zip(*(tokens[i:] for i in range(n)))),
+        dtype=np.int64,
+        count=ngram_total
+    )
+    return np.unique(hashes, return_counts=True)
+
+
+def batched_rouge_n(target_tokens, predictions_tokens, n):
+    """ROUGE-N scores of many tokenized predictions against one reference.
+
+    The reference n-grams are hashed and sorted once; all predictions are then
+    matched against them with a single searchsorted call instead of one
+    Counter intersection per prediction. Results match rouge_score's
+    _score_ngrams up to (negligible) 64-bit hash collisions.
+    """
+    target_ids, target_counts = ngram_counts(target_tokens, n)
+    target_total = target_counts.sum()
+
+    prediction_ids, prediction_counts, owners, prediction_totals = [], [], [], []
+    for index, tokens in enumerate(predictions_tokens):
+        ids, counts = ngram_counts(tokens, n)
+        prediction_ids.append(ids)
+        prediction_counts.append(counts)
+        owners.append(np.full(len(ids), index, dtype=np.int64))
+        prediction_totals.append(counts.sum())
+
+    ids = np.concatenate(prediction_ids) if prediction_ids else np.empty(0, dtype=np.int64)
+    counts = np.concatenate(prediction_counts) if prediction_counts else np.empty(0, dtype=np.int64)
+    owners = np.concatenate(owners) if owners else np.empty(0, dtype=np.int64)
+
+    overlaps = np.zeros(len(predictions_tokens))
+    if len(target_ids) and len(ids):
+        positions = np.minimum(np.searchsorted(target_ids, ids), len(target_ids) - 1)
+        matched = target_ids[positions] == ids
+        overlaps = np.bincount(
+            owners[matched],
+            weights=np.minimum(target_counts[positions[matched]], counts[matched]),
+            minlength=len(predictions_tokens)
+        )
+
+    scores = []
+    for overlap, prediction_total in zip(overlaps, prediction_totals):
+        precision = overlap / max(prediction_total, 1)
+        recall = overlap / max(target_total, 1)
+        scores.append(rouge_scoring.Score(
+            precision=float(precision),
+            recall=float(recall),
+            fmeasure=float(rouge_scoring.fmeasure(precision, recall))
+        ))
+    return scores
+
+
+def _sorted_overlap(target_ids, target_counts, prediction_ids, prediction_counts):
+    """Sum of min counts over ids present in both sorted unique id arrays (merge walk)"""
+    i = j = 0
+    overlap = 0
+    while i < len(target_ids) and j < len(prediction_ids):
+        if target_ids[i] == prediction_ids[j]:
+            overlap += min(target_counts[i], prediction_counts[j])
+            i += 1
+            j += 1
+        elif target_ids[i] < prediction_ids[j]:
+            i += 1
+        else:
+            j += 1
+    return overlap
+
+
+@functools.lru_cache(maxsize=None)
+def compiled_kernels():
+    """(sorted_overlap, lcs_length) compiled with Numba, or (None, None) without it.
+    
+    Numba is optional and only imported here, on the first pure-Python scoring
+    call: with rouge-score-rs installed these kernels are never needed, so the
+    server doesn't pay Numba's import time at start-up.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # rouge_score's pure-Python n-gram/LCS code is used instead
+        return None, None
+    return njit(cache=True)(_sorted_overlap), njit(cache=True)(_lcs_length)
+
+
+def score_ngrams(target_tokens, prediction_tokens, n):
+    """ROUGE-N score, same as rouge_score's _score_ngrams but with a compiled overlap count"""
+    sorted_overlap = compiled_kernels()[0]
+    if sorted_overlap is None:
+        return rouge_scorer._score_ngrams(
+            rouge_scorer._create_ngrams(target_tokens, n),
+            rouge_scorer._create_ngrams(prediction_tokens, n)
+        )
+
+    target_ids, target_counts = ngram_counts(target_tokens, n)
+    prediction_ids, prediction_counts = ngram_counts(prediction_tokens, n)
+    overlap = int(sorted_overlap(target_ids, target_counts, prediction_ids, prediction_counts))
+
+    precision = overlap / max(int(prediction_counts.sum()), 1)
+    recall = overlap / max(int(target_counts.sum()), 1)
+    return rouge_scoring.Score(
+        precision=precision,
+        recall=recall,
+        fmeasure=rouge_scoring.fmeasure(precision, recall)
+    )
+
+
+def _lcs_length(target_ids, prediction_ids):
+    """Length of the longest common subsequence of two int32 token-id arrays.
+
+    Only two rolling rows of the (m+1) x (n+1) DP table are kept.
+    """
+    prev = np.zeros(len(prediction_ids) + 1, dtype=np.int32)
+    cur = np.zeros(len(prediction_ids) + 1, dtype=np.int32)
+    for i in range(1, len(target_ids) + 1):
+        for j in range(1, len(prediction_ids) + 1):
+            if target_ids[i - 1] == prediction_ids[j - 1]:
+                cur[j] = prev[j - 1] + 1
+            else:
+                cur[j] = max(prev[j], cur[j - 1])
+        prev, cur = cur, prev
+    return prev[len(prediction_ids)]
+
+
+def token_ids(tokens, vocab):
+    """Map tokens to int32 ids, adding unseen tokens to the shared vocab dict"""
+    return np.fromiter(
+        (vocab.setdefault(token, len(vocab)) for token in tokens),
+        dtype=np.int32,
+        count=len(tokens)
+    )
+
+
+def score_lcs(target_tokens, prediction_tokens, vocab=None, target_ids=None):
+    """ROUGE-L score, same as rouge_score's _score_lcs but with a compiled LCS.
+
+    Pass a vocab and the reference's target_ids to reuse them across
+    predictions of the same reference.
+    """
+    lcs_length = compiled_kernels()[1]
+    if lcs_length is None:
+        return rouge_scorer._score_lcs(target_tokens, prediction_tokens)
+    if not target_tokens or not prediction_tokens:
+        return rouge_scoring.Score(precision=0, recall=0, fmeasure=0)
+
+    if vocab is None:
+        vocab = {}
+    if target_ids is None:
+        target_ids = token_ids(target_tokens, vocab)
+    length = int(lcs_length(target_ids, token_ids(prediction_tokens, vocab)))
+
+    precision = length / len(prediction_tokens)
+    recall = length / len(target_tokens)
+    return rouge_scoring.Score(
+        precision=precision,
+        recall=recall,
+        fmeasure=rouge_scoring.fmeasure(precision, recall)
+    )
+
+
+class StemCachingTokenizer(tokenizers.DefaultTokenizer):
+    """DefaultTokenizer with an LRU cache in front of the Porter stemmer.
+
+    Summaries reuse a small vocabulary, so most stem() calls repeat a word
+    that has already been stemmed. Output is identical to DefaultTokenizer.
+    """
+
+    def __init__(self, use_stemmer=False, cache_size=4096):
+        super().__init__(use_stemmer)
+        self._stem = functools.lru_cache(maxsize=cache_size)(self._stemmer.stem) if self._stemmer else None
+
+    def tokenize(self, text):
+        text = rouge_tokenize.NON_ALPHANUM_RE.sub(" ", text.lower())
+        tokens = rouge_tokenize.SPACES_RE.split(text)
+        if self._stem:
+            # Only stem words more than 3 characters long, as rouge_score does
+            tokens = [self._stem(token) if len(token) > 3 else token for token in tokens]
+        return [token for token in tokens if rouge_tokenize.VALID_TOKEN_RE.match(token)]
+
+
+class CachedRougeScorer(rouge_scorer.RougeScorer):
+    """RougeScorer that can score against a reference tokenized ahead of time.
+
+    RougeScorer.score tokenizes and stems both texts on every call. In 'all'
+    mode 24 generated summaries share one reference, so the reference side
+    only needs to be tokenized once per article.
+    """
+
+    def __init__(self, rouge_types, use_stemmer=False):
+        super().__init__(rouge_types, tokenizer=StemCachingTokenizer(use_stemmer))
+
+    def tokenize(self, text):
+        """Tokenize (and stem, if enabled) a text the same way score() does"""
+        return self._tokenizer.tokenize(text)
+
+    def score_tokens(self, target_tokens, prediction):
+        """Score a prediction against already tokenized reference tokens"""
+        prediction_tokens = self.tokenize(prediction)
+        result = {}
+        for rouge_type in self.rouge_types:
+            if rouge_type == 'rougeL':
+                result[rouge_type] = score_lcs(target_tokens, prediction_tokens)
+            elif re.match(r"rouge[0-9]$", rouge_type):
+                result[rouge_type] = score_ngrams(target_tokens, prediction_tokens, int(rouge_type[5:]))
+            else:
+                raise ValueError(f"Unsupported rouge type for cached scoring: {rouge_type}")
+        return result
+
+    def score_tokens_batch(self, target_tokens, predictions):
+        """Score several predictions against one tokenized reference.
+
+        ROUGE-N uses the vectorized batched_rouge_n; ROUGE-L runs the
+        compiled LCS per prediction over one shared token-id vocabulary.
+        """
+        predictions_tokens = [self.tokenize(prediction) for prediction in predictions]
+        results = [{} for _ in predictions]
+        for rouge_type in self.rouge_types:
+            if rouge_type == 'rougeL':
+                vocab = {}
+                target_ids = token_ids(target_tokens, vocab)
+                scores = [score_lcs(target_tokens, tokens, vocab, target_ids) for tokens in predictions_tokens]
+            elif re.match(r"rouge[0-9]$", rouge_type):
+                scores = batched_rouge_n(target_tokens, predictions_tokens, int(rouge_type[5:]))
+            else:
+                raise ValueError(f"Unsupported rouge type for cached scoring: {rouge_type}")
+            for result, score in zip(results, scores):
+                result[rouge_type] = score
+        return results
+
+
+def score_fmeasures(scorer, target_tokens, predictions):
+    """ROUGE F-measures ({rouge_type: float}) of predictions against reference tokens.
+
+    A single prediction goes through the compiled per-pair kernels; several
+    predictions share one vectorized batch.
+    """
+    if len(predictions) == 1:
+        results = [scorer.score_tokens(target_tokens, predictions[0])]
+    else:
+        results = scorer.score_tokens_batch(target_tokens, predictions)
+    return [{rouge_type: score.fmeasure for rouge_type, score in result.items()} for result in results]
+
+
+def create_native_scorer(rouge_types, use_stemmer):
+    """Rust-backed scorer from rouge-score-rs, or None when it is not installed"""
+    if native_rouge_scorer is None:
+        return None
+    return native_rouge_scorer.RougeScorer(rouge_types, use_stemmer=use_stemmer)
+
+
+def native_fmeasures(scorer, target, predictions):
+    """ROUGE F-measures of predictions against a reference text using rouge-score-rs.
+
+    score_batch tokenizes, stems and scores natively and releases the GIL, so
+    neither the reference token cache nor the worker processes are needed.
+    """
+    results = scorer.score_batch([target] * len(predictions), predictions)
+    return [{rouge_type: score.fmeasure for rouge_type, score in result.items()} for result in results]
+
+
+# Per-process scorer used by the evaluator's ProcessPoolExecutor workers
+_worker_scorer = None
+
+
+def init_worker_scorer(rouge_types, use_stemmer):
+    """ProcessPoolExecutor initializer: build this worker's scorer and stemmer once"""
+    global _worker_scorer
+    _worker_scorer = CachedRougeScorer(rouge_types, use_stemmer=use_stemmer)
+
+
+def score_in_worker(target_tokens, predictions):
+    """ProcessPoolExecutor task: score_fmeasures with the worker's scorer"""
+    return score_fmeasures(_worker_scorer, target_tokens, predictions)
@@ -4,9 +4,12 @@ This file is used by Azure to start the Flask application.
 """
 
 import os
-from app import app, socketio
 
 if __name__ == "__main__":
+    # Imported here, not at module level: spawned ROUGE worker processes
+    # re-import this script and must not build the Flask app
+    from app import app, socketio
+    
     # Azure App Service will set the PORT environment variable
     port = int(os.environ.get('PORT', 5000))
     
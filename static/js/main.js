@@ -8,6 +8,7 @@ let currentSummarizer = null;
 let results = [];
 let configResults = new Map(); // Store results by configuration
 let availableDatasets = {}; // Store available datasets
+const pendingExports = new Set(); // job_ids of exports started from this page
 
 // Summarizer configuration options
 const SUMMARIZER_CONFIGS = {
@@ -218,7 +219,8 @@ async function startEvaluation() {
                 max_articles: parseInt(maxArticles),
                 evaluation_mode: evaluationMode,
                 selected_config: selectedConfig,
-                selected_dataset: selectedDataset
+                selected_dataset: selectedDataset,
+                socket_id: socket.id  // Joins this page's socket to the session room
             })
         });
 
@@ -268,12 +270,14 @@ async function stopEvaluation() {
 
 async function exportResults() {
     try {
-        const response = await fetch('/api/export_results');
+        // socket_id puts this page's socket in the session room export_ready goes to
+        const response = await fetch(`/api/export_results?socket_id=${encodeURIComponent(socket.id)}`);
         const result = await response.json();
         
-        if (response.ok) {
-            alert(result.message);
-            addLog('Results exported successfully');
+        if (response.ok && !result.error) {
+            // The file is written in the background; 'export_ready' reports completion
+            pendingExports.add(result.job_id);
+            addLog(`Exporting results to ${result.filename}...`);
         } else {
             alert('Error exporting results: ' + result.error);
         }
@@ -351,6 +355,25 @@ function updateProgress(current, total) {
     document.getElementById('progress-text').textContent = `${current} / ${total}`;
 }
 
+// ROUGE metrics the server doesn't compute (see ROUGE_METRICS) arrive as null
+function formatScore(value) {
+    return typeof value === 'number' ? value.toFixed(3) : 'N/A';
+}
+
+// Mean of a metric over results, ignoring missing (null) scores; null if none
+function averageScore(items, metric) {
+    const values = items.map(r => r.rouge_scores[metric]).filter(v => typeof v === 'number');
+    return values.length ? values.reduce((sum, v) => sum + v, 0) / values.length : null;
+}
+
+// Running mean of a configuration's score; stays null for uncomputed metrics
+function runningMean(mean, count, value) {
+    if (typeof value !== 'number') {
+        return mean;
+    }
+    return (((mean || 0) * count) + value) / (count + 1);
+}
+
 function updateResultsSummary() {
     if (results.length === 0) {
         document.getElementById('total-articles').textContent = '0';
@@ -375,9 +398,9 @@ function updateResultsSummary() {
         return;
     }
 
-    const avgRouge1 = validResults.reduce((sum, r) => sum + r.rouge_scores.rouge1, 0) / validResults.length;
-    const avgRouge2 = validResults.reduce((sum, r) => sum + r.rouge_scores.rouge2, 0) / validResults.length;
-    const avgRougeL = validResults.reduce((sum, r) => sum + r.rouge_scores.rougeL, 0) / validResults.length;
+    const avgRouge1 = averageScore(validResults, 'rouge1');
+    const avgRouge2 = averageScore(validResults, 'rouge2');
+    const avgRougeL = averageScore(validResults, 'rougeL');
 
     // Count unique articles and configurations
     const uniqueArticles = new Set(results.map(r => r.article_id)).size;
@@ -385,9 +408,9 @@ function updateResultsSummary() {
 
     document.getElementById('total-articles').textContent = uniqueArticles;
     document.getElementById('total-configs').textContent = uniqueConfigs;
-    document.getElementById('avg-rouge1').textContent = avgRouge1.toFixed(3);
-    document.getElementById('avg-rouge2').textContent = avgRouge2.toFixed(3);
-    document.getElementById('avg-rougeL').textContent = avgRougeL.toFixed(3);
+    document.getElementById('avg-rouge1').textContent = formatScore(avgRouge1);
+    document.getElementById('avg-rouge2').textContent = formatScore(avgRouge2);
+    document.getElementById('avg-rougeL').textContent = formatScore(avgRougeL);
 
     // Find best configuration
     if (configResults.size > 0) {
@@ -395,7 +418,8 @@ function updateResultsSummary() {
         let bestScore = -1;
         
         for (const [config, scores] of configResults) {
-            const avgScore = (scores.rouge1 + scores.rouge2 + scores.rougeL) / 3;
+            const computed = [scores.rouge1, scores.rouge2, scores.rougeL].filter(v => typeof v === 'number');
+            const avgScore = computed.length ? computed.reduce((sum, v) => sum + v, 0) / computed.length : -1;
             if (avgScore > bestScore) {
                 bestScore = avgScore;
                 bestConfig = config;
@@ -424,9 +448,11 @@ function updateConfigurationAnalysis() {
         title.textContent = `${metricNames[index]} Scores by Configuration`;
         chartDiv.appendChild(title);
 
-        // Sort configurations by score
+        // Sort configurations by score (metrics the server doesn't compute are skipped)
         const sortedConfigs = Array.from(configResults.entries())
+            .filter(([_, scores]) => typeof scores[metric] === 'number')
             .sort((a, b) => b[1][metric] - a[1][metric]);
+        if (sortedConfigs.length === 0) return;
 
         const maxScore = Math.max(...sortedConfigs.map(([_, scores]) => scores[metric]));
 
@@ -472,9 +498,9 @@ function updateResultsTable() {
             ((result.article_length - (result.generated_summary ? result.generated_summary.length : 0)) / result.article_length * 100).toFixed(1) : 0;
         
         // Handle missing rouge_scores
-        const rouge1 = result.rouge_scores ? result.rouge_scores.rouge1.toFixed(3) : 'N/A';
-        const rouge2 = result.rouge_scores ? result.rouge_scores.rouge2.toFixed(3) : 'N/A';
-        const rougeL = result.rouge_scores ? result.rouge_scores.rougeL.toFixed(3) : 'N/A';
+        const rouge1 = result.rouge_scores ? formatScore(result.rouge_scores.rouge1) : 'N/A';
+        const rouge2 = result.rouge_scores ? formatScore(result.rouge_scores.rouge2) : 'N/A';
+        const rougeL = result.rouge_scores ? formatScore(result.rouge_scores.rougeL) : 'N/A';
         
         return `
             <tr>
@@ -589,22 +615,36 @@ socket.on('disconnect', function() {
 });
 
 socket.on('log_update', function(data) {
-    addLog(data.message);
+    data.messages.forEach(message => addLog(message));
+});
+
+// Article text arrives once per article in 'article_payload'; summarize
+// requests only carry the dataset and article_id
+const articleTexts = new Map();
+
+function articleKey(data) {
+    // Article IDs are row indexes, so they repeat across datasets
+    return `${data.dataset}:${data.article_id}`;
+}
+
+socket.on('article_payload', function(data) {
+    articleTexts.set(articleKey(data), data.text);
 });
 
 socket.on('evaluation_started', function(data) {
+    articleTexts.clear();
     const datasetInfo = data.dataset ? ` using ${data.dataset}` : '';
     addLog(`Evaluation started with ${data.total_articles} articles${datasetInfo}`);
     updateProgress(0, data.total_articles);
 });
 
-socket.on('progress_update', function(data) {
+function handleProgressUpdate(data) {
     updateProgress(data.current, data.total);
     document.getElementById('current-article').textContent = 
         `Processing article ${data.current} of ${data.total} (ID: ${data.article_id})`;
-});
+}
 
-socket.on('article_completed', function(data) {
+function handleArticleCompleted(data) {
     // Add defensive check for rouge_scores
     if (!data.rouge_scores) {
         console.error('Received article_completed data without rouge_scores:', data);
@@ -618,23 +658,33 @@ socket.on('article_completed', function(data) {
     const config = data.configuration || 'unknown';
     if (!configResults.has(config)) {
         configResults.set(config, {
-            rouge1: 0,
-            rouge2: 0,
-            rougeL: 0,
+            rouge1: null,
+            rouge2: null,
+            rougeL: null,
             count: 0
         });
     }
     
     const configData = configResults.get(config);
-    configData.rouge1 = ((configData.rouge1 * configData.count) + data.rouge_scores.rouge1) / (configData.count + 1);
-    configData.rouge2 = ((configData.rouge2 * configData.count) + data.rouge_scores.rouge2) / (configData.count + 1);
-    configData.rougeL = ((configData.rougeL * configData.count) + data.rouge_scores.rougeL) / (configData.count + 1);
+    configData.rouge1 = runningMean(configData.rouge1, configData.count, data.rouge_scores.rouge1);
+    configData.rouge2 = runningMean(configData.rouge2, configData.count, data.rouge_scores.rouge2);
+    configData.rougeL = runningMean(configData.rougeL, configData.count, data.rouge_scores.rougeL);
     configData.count++;
     
     updateResultsSummary();
     updateResultsTable();
     updateConfigurationAnalysis();
-    addLog(`Completed article ${data.article_id} (${data.configuration}) - ROUGE-1: ${data.rouge_scores.rouge1.toFixed(3)}`);
+    addLog(`Completed article ${data.article_id} (${data.configuration}) - ROUGE-1: ${formatScore(data.rouge_scores.rouge1)}`);
+}
+
+// Progress and completed-article events arrive coalesced; replay them in order
+const batchedEventHandlers = {
+    progress_update: handleProgressUpdate,
+    article_completed: handleArticleCompleted
+};
+
+socket.on('progress_batch', function(events) {
+    events.forEach(({ event, data }) => batchedEventHandlers[event](data));
 });
 
 socket.on('evaluation_completed', function(data) {
@@ -660,8 +710,13 @@ socket.on('summarize_request', async function(data) {
     try {
         addLog(`Received summarization request for article ${data.article_id} (${data.configuration})`);
         
+        const text = articleTexts.get(articleKey(data));
+        if (text === undefined) {
+            throw new Error(`No text received for article ${data.article_id}`);
+        }
+        
         // Log the input data
-        addInputLog(data.article_id, data.text);
+        addInputLog(data.article_id, text);
         
         // Parse configuration
         const [type, length, format] = data.configuration.split('_');
@@ -677,10 +732,10 @@ socket.on('summarize_request', async function(data) {
 
         // Generate summary
         addLog(`Generating ${data.configuration} summary for article ${data.article_id}...`);
-        const summary = await summarizer.summarize(data.text);
+        const summary = await summarizer.summarize(text);
         
         // Log the output data with configuration info
-        addOutputLog(data.article_id, summary, data.text.length, data.configuration);
+        addOutputLog(data.article_id, summary, text.length, data.configuration);
         
         // Clean up
         if (summarizer.destroy) {
@@ -709,6 +764,19 @@ socket.on('summarize_request', async function(data) {
     }
 });
 
+socket.on('export_ready', function(data) {
+    // Ignore exports started from another tab of the same session
+    if (!pendingExports.delete(data.job_id)) {
+        return;
+    }
+    if (data.error) {
+        alert('Error exporting results: ' + data.error);
+    } else {
+        alert(data.message);
+        addLog('Results exported successfully');
+    }
+});
+
 socket.on('summarization_acknowledged', function(data) {
     addLog(`Server acknowledged summarization for article ${data.article_id}`);
 });
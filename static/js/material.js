@@ -103,14 +103,18 @@ function initializeSocketIO() {
         addLog('Disconnected from server', 'warning');
     });
     
-    socket.on('progress_update', function(data) {
-        // Use current/total for sequential numbering instead of article_id
-        const currentArticle = data.current ? `Processing article ${data.current}/${data.total}` : 'Processing...';
-        updateProgress(data.current, data.total, currentArticle);
-    });
+    // Progress and completed-article events arrive coalesced; replay them in order
+    const batchedEventHandlers = {
+        progress_update: function(data) {
+            // Use current/total for sequential numbering instead of article_id
+            const currentArticle = data.current ? `Processing article ${data.current}/${data.total}` : 'Processing...';
+            updateProgress(data.current, data.total, currentArticle);
+        },
+        article_completed: handleArticleCompleted
+    };
     
-    socket.on('article_completed', function(data) {
-        handleArticleCompleted(data);
+    socket.on('progress_batch', function(events) {
+        events.forEach(({ event, data }) => batchedEventHandlers[event](data));
     });
     
     socket.on('evaluation_completed', function(data) {
@@ -127,13 +131,19 @@ function initializeSocketIO() {
         updateDownloadProgress(data.loaded, data.total);
     });
 
+    // Article text arrives once per article; summarize requests reference it by id
+    socket.on('article_payload', function(data) {
+        articleTexts.set(articleKey(data), data.text);
+    });
+
     socket.on('evaluation_started', function(data) {
+        articleTexts.clear();
         addLog(`Evaluation started with ${data.total_articles} articles from ${data.dataset}`, 'success');
         updateProgress(0, data.total_articles, 'Starting...');
     });
 
     socket.on('log_update', function(data) {
-        addLog(data.message, 'info');
+        data.messages.forEach(message => addLog(message, 'info'));
     });
 
     socket.on('summarize_request', function(data) {
@@ -572,7 +582,8 @@ async function startEvaluation() {
     const requestData = {
         max_articles: maxArticles,
         selected_dataset: currentDataset,
-        evaluation_mode: evaluationMode
+        evaluation_mode: evaluationMode,
+        socket_id: socket.id  // Joins this page's socket to the session room
     };
     
     // Only add selected_config for single mode
@@ -893,6 +904,21 @@ function escapeHtml(text) {
   return div.innerHTML.replace(/"/g, '&quot;');
 }
 
+// ROUGE metrics the server doesn't compute (see ROUGE_METRICS) arrive as null
+function formatScore(value) {
+  return typeof value === 'number' ? value.toFixed(3) : 'N/A';
+}
+
+// Mean of a metric over results, ignoring missing (null) scores; null if none
+function averageScore(results, metric) {
+  const values = results
+    .map((r) => r.rouge_scores[metric])
+    .filter((v) => typeof v === 'number');
+  return values.length
+    ? values.reduce((sum, v) => sum + v, 0) / values.length
+    : null;
+}
+
 // Update summary metrics
 function updateSummaryMetrics() {
   const totalArticlesElement = document.getElementById('total-articles');
@@ -907,35 +933,24 @@ function updateSummaryMetrics() {
     .size;
   const uniqueConfigs = new Set(evaluationResults.map((r) => r.config)).size;
 
-  // Calculate averages for results with valid ROUGE scores
-  const validResults = evaluationResults.filter(
-    (r) =>
-      r.rouge_scores &&
-      typeof r.rouge_scores.rouge1 === 'number' &&
-      typeof r.rouge_scores.rouge2 === 'number' &&
-      typeof r.rouge_scores.rougeL === 'number',
-  );
+  // Calculate averages for results with ROUGE scores (missing metrics are skipped)
+  const validResults = evaluationResults.filter((r) => r.rouge_scores);
 
-  let avgRouge1 = 0,
-    avgRouge2 = 0,
-    avgRougeL = 0;
-  if (validResults.length > 0) {
-    avgRouge1 =
-      validResults.reduce((sum, r) => sum + r.rouge_scores.rouge1, 0) /
-      validResults.length;
-    avgRouge2 =
-      validResults.reduce((sum, r) => sum + r.rouge_scores.rouge2, 0) /
-      validResults.length;
-    avgRougeL =
-      validResults.reduce((sum, r) => sum + r.rouge_scores.rougeL, 0) /
-      validResults.length;
-  }
+  const avgRouge1 = averageScore(validResults, 'rouge1');
+  const avgRouge2 = averageScore(validResults, 'rouge2');
+  const avgRougeL = averageScore(validResults, 'rougeL');
 
-  // Find best configuration
+  // Find best configuration (by the first computed metric)
   let bestConfig = 'N/A';
-  if (validResults.length > 0) {
+  const rankMetric = ['rouge1', 'rouge2', 'rougeL'].find(
+    (metric) => averageScore(validResults, metric) !== null,
+  );
+  if (rankMetric) {
     const bestResult = validResults.reduce((best, current) =>
-      current.rouge_scores.rouge1 > best.rouge_scores.rouge1 ? current : best,
+      (current.rouge_scores[rankMetric] ?? -1) >
+      (best.rouge_scores[rankMetric] ?? -1)
+        ? current
+        : best,
     );
     bestConfig = bestResult.config;
   }
@@ -943,9 +958,9 @@ function updateSummaryMetrics() {
   // Update elements
   if (totalArticlesElement) totalArticlesElement.textContent = uniqueArticles;
   if (totalConfigsElement) totalConfigsElement.textContent = uniqueConfigs;
-  if (avgRouge1Element) avgRouge1Element.textContent = avgRouge1.toFixed(3);
-  if (avgRouge2Element) avgRouge2Element.textContent = avgRouge2.toFixed(3);
-  if (avgRougeLElement) avgRougeLElement.textContent = avgRougeL.toFixed(3);
+  if (avgRouge1Element) avgRouge1Element.textContent = formatScore(avgRouge1);
+  if (avgRouge2Element) avgRouge2Element.textContent = formatScore(avgRouge2);
+  if (avgRougeLElement) avgRougeLElement.textContent = formatScore(avgRougeL);
   if (bestConfigElement) bestConfigElement.textContent = bestConfig;
 
   // Reinitialize tooltips for updated content
@@ -965,8 +980,7 @@ function showConfigurationAnalysis() {
   // Group results by configuration
   const configGroups = {};
   evaluationResults.forEach((result) => {
-    if (!result.rouge_scores || typeof result.rouge_scores.rouge1 !== 'number')
-      return;
+    if (!result.rouge_scores) return;
 
     if (!configGroups[result.config]) {
       configGroups[result.config] = [];
@@ -993,29 +1007,17 @@ function showConfigurationAnalysis() {
                 <tbody>
                     ${Object.entries(configGroups)
                       .map(([config, results]) => {
-                        const avgRouge1 =
-                          results.reduce(
-                            (sum, r) => sum + r.rouge_scores.rouge1,
-                            0,
-                          ) / results.length;
-                        const avgRouge2 =
-                          results.reduce(
-                            (sum, r) => sum + r.rouge_scores.rouge2,
-                            0,
-                          ) / results.length;
-                        const avgRougeL =
-                          results.reduce(
-                            (sum, r) => sum + r.rouge_scores.rougeL,
-                            0,
-                          ) / results.length;
+                        const avgRouge1 = averageScore(results, 'rouge1');
+                        const avgRouge2 = averageScore(results, 'rouge2');
+                        const avgRougeL = averageScore(results, 'rougeL');
 
                         return `
                             <tr>
                                 <td><code>${config}</code></td>
                                 <td>${results.length}</td>
-                                <td>${avgRouge1.toFixed(3)}</td>
-                                <td>${avgRouge2.toFixed(3)}</td>
-                                <td>${avgRougeL.toFixed(3)}</td>
+                                <td>${formatScore(avgRouge1)}</td>
+                                <td>${formatScore(avgRouge2)}</td>
+                                <td>${formatScore(avgRougeL)}</td>
                             </tr>
                         `;
                       })
@@ -1672,11 +1674,24 @@ async function copyToClipboard(button, text) {
   }
 }
 
+// Article texts sent by the backend in 'article_payload', keyed by articleKey()
+const articleTexts = new Map();
+
+// Article IDs are row indexes, so they repeat across datasets
+function articleKey(data) {
+  return `${data.dataset}:${data.article_id}`;
+}
+
 // Handle summarization request from backend
 async function handleSummarizeRequest(data) {
-  const { request_id, article_id, text, configuration } = data;
+  const { request_id, article_id, configuration } = data;
 
   try {
+    const text = articleTexts.get(articleKey(data));
+    if (text === undefined) {
+      throw new Error(`No text received for article ${article_id}`);
+    }
+
     addLog(
       `Processing summarization request for article ${article_id} with ${configuration}`,
       'info',
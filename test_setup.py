@@ -5,15 +5,22 @@ Test script to verify the Browser Summarization Quality Evaluation setup.
 
 import sys
 import os
+import functools
 import importlib.util
+import time
 
 def test_imports():
-    """Test if all required packages can be imported"""
+    """Test if all required packages can be imported.
+    
+    Each package is really imported (so broken installs are caught) and timed;
+    the check stops at the first package that fails.
+    """
     required_packages = [
         'flask',
         'flask_socketio', 
         'pandas',
         'datasets',
+        'cachetools',
         'evaluate',
         'rouge_score',
         'numpy',
@@ -24,12 +31,14 @@ def test_imports():
     failed_imports = []
     
     for package in required_packages:
+        start = time.perf_counter()
         try:
-            __import__(package)
-            print(f"  ✅ {package}")
-        except ImportError as e:
+            importlib.import_module(package)
+        except Exception as e:  # ImportError, but also ABI/native library errors
             print(f"  ❌ {package}: {e}")
             failed_imports.append(package)
+            break
+        print(f"  ✅ {package} ({(time.perf_counter() - start) * 1000:.0f} ms)")
     
     return failed_imports
 
@@ -69,7 +78,7 @@ def test_sample_data():
     print("\n📊 Testing sample data...")
     try:
         import config
-        sample_articles = config.SAMPLE_ARTICLES
+        sample_articles = config.get_sample_articles()
         print(f"  ✅ {len(sample_articles)} sample articles available")
         
         for i, article in enumerate(sample_articles):
@@ -83,12 +92,18 @@ def test_sample_data():
         print(f"  ❌ Sample data error: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
+def get_scorer():
+    """Build the ROUGE scorer (and its Porter stemmer) once, with the app's settings"""
+    import config
+    from rouge_score import rouge_scorer
+    return rouge_scorer.RougeScorer(config.ROUGE_METRICS, use_stemmer=config.USE_STEMMER)
+
 def test_rouge_scorer():
     """Test ROUGE scorer functionality"""
     print("\n📝 Testing ROUGE scorer...")
     try:
-        from rouge_score import rouge_scorer
-        scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
+        scorer = get_scorer()
         
         # Test with sample text
         reference = "The cat sat on the mat"